@@ -45,7 +45,7 @@ TRANSLATE_PREFIX: str = os.environ.get("TRANSLATE_PREFIX", "[translate]").strip(
 # For trigger=reaction: only translate when this emoji is added to a message. Use the shortcode name without colons (e.g. "de" for :de:, "globe" for :globe:).
 REACTION_TRIGGER_EMOJI: str = os.environ.get("REACTION_TRIGGER_EMOJI", "de").strip().lower() or "de"
 
-# If the message contains any of these phrases, only the text *after* the phrase is translated (the preamble is skipped). Comma-separated, case-insensitive. First match wins. Longer phrases are checked first.
+# If the message contains any of these phrases, only the text *after* the phrase is translated (the preamble is skipped). Comma-separated, case-insensitive. The earliest match in the message wins; at the same position the longer phrase wins.
 _DEFAULT_EXTRACT = (
     "Can you please assist us with a translation of the following:,"
     "Can you translate the following:,"
@@ -57,3 +57,18 @@ EXTRACT_CONTENT_AFTER: str = os.environ.get("EXTRACT_CONTENT_AFTER", _DEFAULT_EX
 EXTRACT_PHRASES_LIST: list[str] = [p.strip() for p in EXTRACT_CONTENT_AFTER.split(",") if p.strip()]
 # Sort by length descending so we match the longest phrase first (strip more preamble)
 EXTRACT_PHRASES_LIST.sort(key=len, reverse=True)
+
+# Idempotency store for Slack retries: "memory" = per-process (default), "redis" = shared across
+# workers/instances and restarts (needs the redis package and REDIS_URL, e.g. redis://localhost:6379/0).
+# With "redis", the bot user ID is cached there as well.
+IDEMPOTENCY_BACKEND: str = os.environ.get("IDEMPOTENCY_BACKEND", "memory").strip().lower() or "memory"
+REDIS_URL: str = os.environ.get("REDIS_URL", "").strip()
+# How long a processed message key is remembered (seconds), by either idempotency backend
+IDEMPOTENCY_TTL_SECONDS: int = int(os.environ.get("IDEMPOTENCY_TTL_SECONDS", "3600"))
+# DeepL translations are always kept in a per-process LRU; "redis" also shares them via REDIS_URL.
+# Defaults to IDEMPOTENCY_BACKEND, so one setting still moves everything to Redis.
+TRANSLATION_CACHE_BACKEND: str = (
+    os.environ.get("TRANSLATION_CACHE_BACKEND", IDEMPOTENCY_BACKEND).strip().lower() or IDEMPOTENCY_BACKEND
+)
+# For TRANSLATION_CACHE_BACKEND=redis: how long a cached DeepL translation is kept (seconds, default 7 days)
+TRANSLATION_CACHE_TTL_SECONDS: int = int(os.environ.get("TRANSLATION_CACHE_TTL_SECONDS", "604800"))
@@ -2,37 +2,79 @@
 Slack Events API endpoint: on new channel message, translate EN -> DE and post as thread reply.
 """
 
+import asyncio
+import hashlib
 import logging
 import os
 import re
+import sys
+import tempfile
+import time
 from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Awaitable, Callable
 
-from fastapi import FastAPI, Request, Response
-from fastapi.responses import JSONResponse, PlainTextResponse
+import httpx
+from fastapi import BackgroundTasks, FastAPI, Request, Response
+from fastapi.responses import PlainTextResponse
 
 from . import config
 from .slack_verify import verify_slack_request
-from .translate import translate_en_to_de
+from .translate import cached_translations, store_translations, translate_en_to_de_batch, translation_cache_key
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 # Slack emoji shortcodes :name: — we replace with placeholders so DeepL doesn't translate them
-_EMOJI_PATTERN = re.compile(r":([a-zA-Z0-9_+]+):")
+# Names made only of digits and hyphens are times like 10:30-11:00, not emoji
+_EMOJI_PATTERN = re.compile(r":(?![\d-]+:)([a-zA-Z0-9_+\-]+):")
 _EMOJI_PLACEHOLDER = "EMOJISLACK"
+_RESTORE_PATTERN = re.compile(rf":{_EMOJI_PLACEHOLDER}(\d+):")
+# Any Unicode letter (word character that is not a digit or underscore)
+_ALNUM = re.compile(r"[^\W_]")
 
 
 def _replace_slack_emojis_for_translation(text: str) -> tuple[str, list[str]]:
     """Replace :shortcode: with placeholders. Returns (modified_text, list of original shortcodes in order)."""
+    if ":" not in text:
+        return text, []
+    # Walk matches once and join slices at the end (no per-match re.sub callback).
+    out: list[str] = []
     shortcodes: list[str] = []
-    def repl(m: re.Match) -> str:
-        shortcodes.append(":" + m.group(1) + ":")
-        return f":{_EMOJI_PLACEHOLDER}{len(shortcodes)-1}:"
-    return _EMOJI_PATTERN.sub(repl, text), shortcodes
+    last = 0
+    for i, m in enumerate(_EMOJI_PATTERN.finditer(text)):
+        out.append(text[last : m.start()])
+        out.append(f":{_EMOJI_PLACEHOLDER}{i}:")
+        shortcodes.append(m.group(0))
+        last = m.end()
+    if not shortcodes:
+        return text, []
+    out.append(text[last:])
+    return "".join(out), shortcodes
 
 
 def _restore_slack_emojis(text: str, shortcodes: list[str]) -> str:
-    """Put original :shortcode: back in place of placeholders."""
-    for i, orig in enumerate(shortcodes):
-        text = text.replace(f":{_EMOJI_PLACEHOLDER}{i}:", orig)
-    return text
+    """Put original :shortcode: back in place of placeholders (one pass over the text)."""
+    if not shortcodes:
+        return text
+    count = len(shortcodes)
+
+    def _shortcode(m: re.Match[str]) -> str:
+        i = int(m.group(1))
+        # DeepL may mangle a placeholder index; keep the placeholder rather than fail the reply
+        return shortcodes[i] if i < count else m.group(0)
+
+    return _RESTORE_PATTERN.sub(_shortcode, text)
 
 
 def _split_headline_body(text: str) -> tuple[str, str]:
@@ -40,37 +82,99 @@ def _split_headline_body(text: str) -> tuple[str, str]:
     Split l10n-style content into headline (first line) and body (rest).
     Ensures DeepL translates them separately so the reply keeps two lines.
     """
-    text = (text or "").strip()
-    if not text:
-        return ("", "")
-    idx = text.find("\n")
-    if idx < 0:
-        return (text, "")
-    headline = text[:idx].strip()
-    body = text[idx + 1 :].strip()
-    return (headline, body)
+    headline, _, body = (text or "").strip().partition("\n")
+    return (headline.strip(), body.strip())
+
+
+def _has_text(text: str) -> bool:
+    """True if text has a letter or digit outside emoji placeholders (numbers get localized, e.g. 2.4 -> 2,4)."""
+    return _ALNUM.search(_RESTORE_PATTERN.sub("", text)) is not None
 
 
-def _translate_headline_and_body(text: str) -> str | None:
+# DeepL handles ~10-20 concurrent requests per key well; more just queue up in worker threads.
+_MAX_DEEPL_CONCURRENCY = 20
+_deepl_slots = asyncio.Semaphore(_MAX_DEEPL_CONCURRENCY)
+
+
+async def _deepl_batch(texts: list[str]) -> list[str | None]:
+    """Run the blocking DeepL batch in a worker thread, bounded by _MAX_DEEPL_CONCURRENCY."""
+    async with _deepl_slots:
+        return await asyncio.to_thread(translate_en_to_de_batch, texts)
+
+
+def _translation_cache_key(text: str) -> str:
+    normalized = translation_cache_key(text)
+    return f"tr:en-de:{hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()}"
+
+
+async def _translate_segments(texts: list[str]) -> list[str | None]:
+    """
+    Translate segments via translate_en_to_de_batch (in a worker thread). With
+    TRANSLATION_CACHE_BACKEND=redis, segments missing from the in-process LRU are looked up in
+    Redis (shared across workers/instances) before DeepL; new translations are stored there.
+    """
+    redis_client = _get_translation_redis()
+    if redis_client is None:
+        return await _deepl_batch(texts)
+    results: list[str | None] = [None] * len(texts)
+    local = cached_translations(texts)
+    for i, t in local.items():
+        results[i] = t
+    misses = [i for i in range(len(texts)) if i not in local]
+    if not misses:
+        return results
+    keys = {i: _translation_cache_key(texts[i]) for i in misses}
+    try:
+        cached = await redis_client.mget([keys[i] for i in misses])
+    except Exception as e:
+        logger.warning("Redis translation cache lookup failed: %s", e)
+        cached = [None] * len(misses)
+    shared_hits: list[tuple[str, str]] = []
+    for i, c in zip(misses, cached):
+        if c is not None:
+            results[i] = c.decode("utf-8") if isinstance(c, bytes) else c
+            shared_hits.append((texts[i], results[i]))
+    if shared_hits:
+        store_translations(shared_hits)
+    misses = [i for i, c in zip(misses, cached) if c is None]
+    if not misses:
+        return results
+    fresh = await _deepl_batch([texts[i] for i in misses])
+    to_store: dict[str, str] = {}
+    for i, t in zip(misses, fresh):
+        results[i] = t
+        if t is not None:
+            to_store[keys[i]] = t
+    if to_store:
+        try:
+            ttl = config.TRANSLATION_CACHE_TTL_SECONDS
+            await asyncio.gather(*(redis_client.set(k, v, ex=ttl) for k, v in to_store.items()))
+        except Exception as e:
+            logger.warning("Redis translation cache write failed: %s", e)
+    return results
+
+
+async def _translate_headline_and_body(text: str) -> str | None:
     """
     Translate extracted content by splitting into headline and body, translating each
-    separately, then rejoining with a newline so the reply keeps headline and body on separate lines.
+    separately (in one DeepL request), then rejoining with a newline so the reply keeps
+    headline and body on separate lines. The blocking DeepL call runs in a worker thread
+    so the event loop keeps serving other Slack events meanwhile.
     """
     if not text or not text.strip():
         return None
     text_for_deepl, emoji_shortcodes = _replace_slack_emojis_for_translation(text)
     headline, body = _split_headline_body(text_for_deepl)
 
-    parts: list[str] = []
-    if headline:
-        t = translate_en_to_de(headline)
-        parts.append(t if t else headline)
-    if body:
-        t = translate_en_to_de(body)
-        parts.append(t if t else body)
-
-    if not parts:
+    parts = [part for part in (headline, body) if part]
+    # Emoji/punctuation-only segments have nothing for DeepL; keep them as they are.
+    wordy = [i for i, part in enumerate(parts) if _has_text(part)]
+    if not wordy:
         return None
+    results = await _translate_segments([parts[i] for i in wordy])
+    for i, t in zip(wordy, results):
+        if t:
+            parts[i] = t
     translated = "\n".join(parts)
     return _restore_slack_emojis(translated, emoji_shortcodes)
 
@@ -81,44 +185,284 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Slack EN->DE Translate")
+# Shared Slack Web API client: one connection pool (keep-alive, HTTP/2) reused across events
+# instead of a TCP+TLS handshake per call. Created in the app lifespan; see _get_http().
+_http: httpx.AsyncClient | None = None
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=15.0,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+
+
+def _get_http() -> httpx.AsyncClient:
+    """Return the shared httpx.AsyncClient (created on demand when used outside the app lifespan)."""
+    global _http
+    if _http is None:
+        _http = _new_http_client()
+    return _http
+
+
+# Shared Redis client for the Redis-backed caches; created on first use, closed in the lifespan.
+_redis: Any = None
+_REDIS_TIMEOUT_SECONDS = 0.3
+
+
+def _redis_client() -> Any:
+    """Return the shared redis.asyncio client, or None without REDIS_URL or the redis package."""
+    global _redis
+    if not config.REDIS_URL:
+        return None
+    if _redis is None:
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError:
+            logger.warning("Redis backend configured but the redis package is not installed; using memory")
+            return None
+        # Idempotency is checked before the ack: an unreachable Redis must fail fast (then memory is
+        # used) instead of holding the response past Slack's 3s deadline.
+        _redis = redis_asyncio.Redis.from_url(
+            config.REDIS_URL,
+            socket_connect_timeout=_REDIS_TIMEOUT_SECONDS,
+            socket_timeout=_REDIS_TIMEOUT_SECONDS,
+        )
+    return _redis
+
+
+def _get_redis() -> Any:
+    """Return the Redis client for idempotency and the bot user ID, or None when IDEMPOTENCY_BACKEND=memory."""
+    if config.IDEMPOTENCY_BACKEND != "redis":
+        return None
+    return _redis_client()
+
+
+def _get_translation_redis() -> Any:
+    """Return the Redis client for shared translations, or None when TRANSLATION_CACHE_BACKEND=memory."""
+    if config.TRANSLATION_CACHE_BACKEND != "redis":
+        return None
+    return _redis_client()
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    global _http, _redis
+    _http = _new_http_client()
+    if config.TRANSLATE_TRIGGER == "mention":
+        # Resolve the bot ID before the first event so mentions never wait on auth.test.
+        await _get_bot_user_id()
+    try:
+        yield
+    finally:
+        client, _http = _http, None
+        await client.aclose()
+        if _redis is not None:
+            redis_client, _redis = _redis, None
+            await redis_client.aclose()
+
+
+app = FastAPI(title="Slack EN->DE Translate", lifespan=_lifespan)
+
+# Slack Web API endpoints
+_AUTH_TEST_URL = "https://slack.com/api/auth.test"
+_REACTIONS_GET_URL = "https://slack.com/api/reactions.get"
+_HISTORY_URL = "https://slack.com/api/conversations.history"
+_REPLIES_URL = "https://slack.com/api/conversations.replies"
+_POST_URL = "https://slack.com/api/chat.postMessage"
+
+
+@lru_cache(maxsize=8)
+def _auth_headers(token: str) -> dict[str, str]:
+    """Authorization header for a Slack token. Tokens are fixed config, so each dict is built once."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+@lru_cache(maxsize=8)
+def _json_headers(token: str) -> dict[str, str]:
+    """Authorization + JSON content type (chat.postMessage). Built once per token."""
+    return {**_auth_headers(token), "Content-Type": "application/json; charset=utf-8"}
+
+
+# Whitespace runs, collapsed to one space after removing the bot mention
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+# Cheap byte prefilter for reaction mode: payloads that cannot be one of the event types handled
+# there (reactions, message/message_changed, url_verification) are acked without parsing JSON.
+# It can let others through (e.g. events whose item is a message); the handlers ignore those.
+_REACTION_MODE_EVENTS = re.compile(
+    rb'"(?:reaction_added|reaction_removed|message_changed|url_verification)"|"type":\s*"message"'
+)
 
 # conversations.history/replies may enforce max=15 for some app types.
 _SLACK_HISTORY_LIMIT = 15
 _SLACK_REPLIES_LIMIT = 15
 
 # Idempotency: avoid posting duplicate translations when Slack retries.
-# In-memory (channel_id, ts) with bounded size; for multi-instance use Redis.
+# In-memory (channel_id, ts) -> time first seen, bounded by size and by IDEMPOTENCY_TTL_SECONDS
+# (same expiry as the Redis keys); for multi-instance use Redis. Insertion order is age order, so eviction pops the front.
 _MAX_IDEMPOTENCY_SIZE = 10_000
-_processed: OrderedDict[tuple[str, str], None] = OrderedDict()
+_processed: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+# Slack rate limits are per method: after a 429, hold further calls to that method until Retry-After
+# has passed (shared by all jobs) instead of letting other lookups burn more of the budget.
+_MAX_RETRY_AFTER_SECONDS = 30.0
+_slack_next_allowed: dict[str, float] = {}
+
+
+async def _wait_for_slack_method(url: str) -> None:
+    delay = _slack_next_allowed.get(url, 0.0) - time.monotonic()
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+def _note_slack_rate_limit(url: str, headers: httpx.Headers) -> float:
+    """Record a 429 for this method; returns the delay (seconds) before it may be called again."""
+    try:
+        delay = float(headers.get("Retry-After", "1"))
+    except ValueError:
+        delay = 1.0
+    delay = min(max(delay, 0.0), _MAX_RETRY_AFTER_SECONDS)
+    _slack_next_allowed[url] = max(_slack_next_allowed.get(url, 0.0), time.monotonic() + delay)
+    return delay
+
 
-# Bot user ID for "mention" trigger (fetched once via auth.test)
+# Reaction mode: recent user messages seen via message events, (channel, ts) -> (text, reply_thread_ts),
+# so a reaction on a recent message skips the conversations.history/replies lookups.
+_RECENT_MESSAGES_SIZE = 2048
+_recent_messages: OrderedDict[tuple[str, str], tuple[str, str]] = OrderedDict()
+
+
+def _remember_message(channel_id: str, ts: str, text: str, reply_thread_ts: str) -> None:
+    key = (channel_id, ts)
+    _recent_messages[key] = (text, reply_thread_ts)
+    _recent_messages.move_to_end(key)
+    if len(_recent_messages) > _RECENT_MESSAGES_SIZE:
+        _recent_messages.popitem(last=False)
+
+
+# Translation work runs after the ack; cap how many jobs talk to Slack/DeepL at once.
+_MAX_ACTIVE_JOBS = 64
+_job_slots = asyncio.Semaphore(_MAX_ACTIVE_JOBS)
+
+# Bot user ID for "mention" trigger (fetched once via auth.test) and its "<@ID>" mention markup
 _bot_user_id: str | None = None
+_bot_mention: str | None = None
+
+
+def _set_bot_user_id(user_id: str) -> None:
+    global _bot_user_id, _bot_mention
+    _bot_user_id = user_id
+    _bot_mention = f"<@{user_id}>"
 
 
-def _get_bot_user_id() -> str | None:
-    """Fetch our bot's user ID from Slack (for mention trigger). Cached after first call."""
-    global _bot_user_id
+_BOT_USER_ID_REDIS_TTL_SECONDS = 86_400
+_BOT_USER_ID_PATTERN = re.compile(r"[UW][A-Z0-9]+")
+
+
+def _valid_bot_user_id(cached: str | None) -> str | None:
+    """Return cached if it looks like a Slack user ID; a corrupt or foreign value counts as a miss."""
+    if cached and _BOT_USER_ID_PATTERN.fullmatch(cached):
+        return cached
+    if cached:
+        logger.warning("ignoring invalid cached bot user ID %r", cached[:32])
+    return None
+
+
+def _bot_token_digest(token: str) -> str:
+    """Short hash of the bot token for cache keys (never store the token itself)."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def _bot_user_id_cache_file(token: str) -> Path:
+    """Per-token cache file for the bot user ID."""
+    return Path(tempfile.gettempdir()) / f"slack_bot_id_{_bot_token_digest(token)}"
+
+
+def _read_cached_bot_user_id(token: str) -> str | None:
+    try:
+        cached = _bot_user_id_cache_file(token).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return _valid_bot_user_id(cached)
+
+
+def _write_cached_bot_user_id(token: str, user_id: str) -> None:
+    """Write atomically (temp file + os.replace) so concurrent workers never read a partial ID."""
+    path = _bot_user_id_cache_file(token)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(user_id, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("could not cache bot user ID in %s: %s", path, e)
+
+
+async def _read_redis_bot_user_id(token: str) -> str | None:
+    redis_client = _get_redis()
+    if redis_client is None:
+        return None
+    try:
+        cached = await redis_client.get(f"bot_user_id:{_bot_token_digest(token)}")
+    except Exception as e:
+        logger.warning("Redis bot user ID lookup failed: %s", e)
+        return None
+    if isinstance(cached, bytes):
+        cached = cached.decode("utf-8", errors="replace")
+    return _valid_bot_user_id(cached if isinstance(cached, str) else None)
+
+
+async def _write_redis_bot_user_id(token: str, user_id: str) -> None:
+    redis_client = _get_redis()
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(
+            f"bot_user_id:{_bot_token_digest(token)}", user_id, ex=_BOT_USER_ID_REDIS_TTL_SECONDS
+        )
+    except Exception as e:
+        logger.warning("Redis bot user ID write failed: %s", e)
+
+
+async def _get_bot_user_id() -> str | None:
+    """
+    Fetch our bot's user ID from Slack (for mention trigger). Cached in memory after the first
+    call, and on disk (and in Redis when configured) across restarts and instances, so a new
+    worker does not pay an auth.test round-trip.
+    """
     if _bot_user_id is not None:
         return _bot_user_id
     if not config.SLACK_BOT_TOKEN:
         return None
+    cached = _read_cached_bot_user_id(config.SLACK_BOT_TOKEN)
+    if not cached:
+        cached = await _read_redis_bot_user_id(config.SLACK_BOT_TOKEN)
+        if cached:
+            _write_cached_bot_user_id(config.SLACK_BOT_TOKEN, cached)
+    if cached:
+        _set_bot_user_id(cached)
+        return _bot_user_id
     try:
-        import httpx
-        r = httpx.post(
-            "https://slack.com/api/auth.test",
-            headers={"Authorization": f"Bearer {config.SLACK_BOT_TOKEN}"},
+        r = await _get_http().post(
+            _AUTH_TEST_URL,
+            headers=_auth_headers(config.SLACK_BOT_TOKEN),
             timeout=10.0,
         )
-        if r.status_code == 200 and r.json().get("ok"):
-            _bot_user_id = r.json().get("user_id")
-            return _bot_user_id
+        j = _json_loads(r.content)
+        if r.status_code == 200 and j.get("ok"):
+            user_id = j.get("user_id")
+            if user_id:
+                _set_bot_user_id(user_id)
+                _write_cached_bot_user_id(config.SLACK_BOT_TOKEN, user_id)
+                await _write_redis_bot_user_id(config.SLACK_BOT_TOKEN, user_id)
+            return user_id
     except Exception as e:
         logger.warning("auth.test failed: %s", e)
     return None
 
 
-def _should_translate_and_strip(text: str) -> str | None:
+async def _should_translate_and_strip(text: str) -> str | None:
     """
     If we should translate this message, return the text to send to DeepL (possibly stripped of prefix/mention).
     Otherwise return None.
@@ -133,23 +477,32 @@ def _should_translate_and_strip(text: str) -> str | None:
         stripped = text[len(prefix):].strip()
         return stripped if stripped else None
     if trigger == "mention":
-        bot_id = _get_bot_user_id()
-        if not bot_id:
-            logger.warning("TRANSLATE_TRIGGER=mention but could not get bot user ID")
+        bot_mention = _bot_mention
+        if bot_mention is None:
+            bot_id = await _get_bot_user_id()
+            if not bot_id:
+                logger.warning("TRANSLATE_TRIGGER=mention but could not get bot user ID")
+                return None
+            bot_mention = f"<@{bot_id}>"
+        # Remove the mention so we don't translate it; leave the rest (one scan finds and splits)
+        before, mention, after = text.partition(bot_mention)
+        if not mention:
             return None
-        mention = f"<@{bot_id}>"
-        if mention not in text:
-            return None
-        # Remove the mention so we don't translate it; leave the rest
-        stripped = text.replace(mention, " ", 1).strip()
-        stripped = " ".join(stripped.split())  # collapse spaces
+        stripped = _WHITESPACE_RUN.sub(" ", f"{before} {after}").strip()  # collapse spaces
         return stripped if stripped else None
     return text
 
 
+_REACTION_NAME_TABLE = str.maketrans("-", "_")
+
+
+@lru_cache(maxsize=256)
 def _normalize_reaction_name(name: str) -> str:
-    """Normalize Slack emoji shortcodes for robust matching."""
-    return (name or "").strip().lower().replace("-", "_")
+    """
+    Normalize Slack emoji shortcodes for robust matching. Memoized: the configured trigger
+    and the handful of emoji people actually use are normalized once, not on every event.
+    """
+    return (name or "").strip().lower().translate(_REACTION_NAME_TABLE)
 
 
 def _message_has_reaction(message: dict, reaction_name: str) -> bool:
@@ -168,28 +521,40 @@ def _message_has_reaction(message: dict, reaction_name: str) -> bool:
     return False
 
 
-def _fetch_message_reactions(channel_id: str, message_ts: str) -> list[dict] | None:
+# Short-lived reactions.get results per (channel, ts): one edit often arrives as several
+# message_changed events. Dropped whenever a reaction_added/removed event names the message.
+_REACTIONS_CACHE_TTL_SECONDS = 2.0
+_REACTIONS_CACHE_SIZE = 4096
+_reactions_cache: OrderedDict[tuple[str, str], tuple[float, list[dict]]] = OrderedDict()
+
+
+async def _fetch_message_reactions(channel_id: str, message_ts: str) -> list[dict] | None:
     """
-    Fetch current reactions for a message via reactions.get.
+    Fetch current reactions for a message via reactions.get (cached for a couple of seconds).
     Returns list of reaction dicts, or None if unavailable/error.
     """
     if not config.SLACK_BOT_TOKEN:
         return None
+    key = (channel_id, message_ts)
+    cached = _reactions_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _REACTIONS_CACHE_TTL_SECONDS:
+        return cached[1]
     try:
-        import httpx
-    except ImportError:
-        return None
-    try:
-        r = httpx.post(
-            "https://slack.com/api/reactions.get",
-            headers={"Authorization": f"Bearer {config.SLACK_BOT_TOKEN}"},
+        r = await _get_http().post(
+            _REACTIONS_GET_URL,
+            headers=_auth_headers(config.SLACK_BOT_TOKEN),
             data={"channel": channel_id, "timestamp": message_ts, "full": False},
             timeout=10.0,
         )
-        j = r.json()
+        j = _json_loads(r.content)
         if r.status_code == 200 and j.get("ok"):
             message_obj = j.get("message") or {}
-            return message_obj.get("reactions") or []
+            reactions = message_obj.get("reactions") or []
+            _reactions_cache[key] = (time.monotonic(), reactions)
+            _reactions_cache.move_to_end(key)
+            if len(_reactions_cache) > _REACTIONS_CACHE_SIZE:
+                _reactions_cache.popitem(last=False)
+            return reactions
         logger.warning(
             "reactions.get failed channel=%s ts=%s error=%s",
             channel_id,
@@ -201,7 +566,7 @@ def _fetch_message_reactions(channel_id: str, message_ts: str) -> list[dict] | N
     return None
 
 
-def _message_has_trigger_reaction(
+async def _message_has_trigger_reaction(
     channel_id: str,
     message_ts: str,
     reaction_name: str,
@@ -216,12 +581,36 @@ def _message_has_trigger_reaction(
         return _message_has_reaction(edited_message, reaction_name)
     if previous_message.get("reactions") is not None:
         return _message_has_reaction(previous_message, reaction_name)
-    live_reactions = _fetch_message_reactions(channel_id, message_ts)
+    live_reactions = await _fetch_message_reactions(channel_id, message_ts)
     if live_reactions is None:
         return False
     return _message_has_reaction({"reactions": live_reactions}, reaction_name)
 
 
+# Compiled preamble regex, the phrase list it was built from, and a character every phrase ends
+# with (":" for the defaults) so messages without it skip the regex entirely
+_extract_phrases_source: list[str] | None = None
+_extract_phrases_re: re.Pattern[str] | None = None
+_extract_phrases_sentinel: str | None = None
+
+
+def _compile_extract_phrases(phrases: list[str]) -> re.Pattern[str]:
+    """
+    One case-insensitive alternation for all preamble phrases, so a message is scanned once
+    instead of once per phrase. Phrases are longest-first, so the longest wins at a given position.
+    Rebuilt only when the configured list object is replaced (identity check, no per-call hashing).
+    """
+    global _extract_phrases_source, _extract_phrases_re, _extract_phrases_sentinel
+    if phrases is not _extract_phrases_source or _extract_phrases_re is None:
+        _extract_phrases_re = re.compile("|".join(map(re.escape, phrases)), re.IGNORECASE)
+        last_chars = {p[-1] for p in phrases}
+        sentinel = last_chars.pop() if len(last_chars) == 1 else None
+        # Only caseless characters are safe for a plain substring test
+        _extract_phrases_sentinel = sentinel if sentinel and sentinel.lower() == sentinel.upper() else None
+        _extract_phrases_source = phrases
+    return _extract_phrases_re
+
+
 def _extract_content_to_translate(text: str) -> str:
     """
     If the message contains a known preamble phrase (e.g. 'translation of the following:'),
@@ -230,27 +619,49 @@ def _extract_content_to_translate(text: str) -> str:
     """
     if not text or not config.EXTRACT_PHRASES_LIST:
         return text
-    lower = text.lower()
-    for phrase in config.EXTRACT_PHRASES_LIST:
-        pos = lower.find(phrase.lower())
-        if pos >= 0:
-            after = text[pos + len(phrase) :].strip()
-            if after:
-                return after
+    pattern = _compile_extract_phrases(config.EXTRACT_PHRASES_LIST)
+    if _extract_phrases_sentinel is not None and _extract_phrases_sentinel not in text:
+        return text
+    for m in pattern.finditer(text):
+        after = text[m.end() :].strip()
+        if after:
+            return after
     return text
 
 
-def _already_processed(channel_id: str, ts: str) -> bool:
+def _already_processed_in_memory(channel_id: str, ts: str) -> bool:
     key = (channel_id, ts)
-    if key in _processed:
-        return True
-    _processed[key] = None
-    while len(_processed) > _MAX_IDEMPOTENCY_SIZE:
+    ttl = config.IDEMPOTENCY_TTL_SECONDS
+    now = time.monotonic()
+    seen = _processed.get(key)
+    if seen is not None:
+        if now - seen < ttl:
+            return True
+        del _processed[key]  # expired: record again as the newest entry
+    _processed[key] = now
+    cutoff = now - ttl
+    while len(_processed) > _MAX_IDEMPOTENCY_SIZE or next(iter(_processed.values())) < cutoff:
         _processed.popitem(last=False)
     return False
 
 
-def _fetch_message(
+async def _already_processed(channel_id: str, ts: str) -> bool:
+    """Return True if (channel_id, ts) was seen before; otherwise record it and return False."""
+    redis_client = _get_redis()
+    if redis_client is not None:
+        try:
+            # SET NX EX: one round-trip, shared by all workers, expires on its own.
+            created = await redis_client.set(
+                f"idem:{channel_id}:{ts}", "1", nx=True, ex=config.IDEMPOTENCY_TTL_SECONDS
+            )
+        except Exception as e:
+            logger.warning("Redis idempotency check failed, using memory: %s", e)
+        else:
+            return not created
+    return _already_processed_in_memory(channel_id, ts)
+
+
+async def _fetch_message(
     channel_id: str, ts: str, thread_ts: str | None = None
 ) -> tuple[str | None, str | None]:
     """
@@ -258,33 +669,41 @@ def _fetch_message(
     Returns (message_text, reply_thread_ts). reply_thread_ts is the thread_ts to use
     when posting the translation reply (parent message ts for threads, or message ts for channel messages).
 
-    Tries conversations.history first (channel messages). If not found, tries
-    conversations.replies directly, then falls back to parent discovery
-    (history + replies) for workspaces where replies(ts=reply_ts) is rejected.
+    When thread_ts (the parent ts) is given, looks only in that thread and skips channel
+    history, which never contains thread replies. Otherwise tries conversations.history
+    first (channel messages). If not found, tries conversations.replies directly, then
+    falls back to parent discovery (history + replies) for workspaces where
+    replies(ts=reply_ts) is rejected.
     """
     if not config.SLACK_BOT_TOKEN:
         return (None, None)
+    http = _get_http()
     try:
-        import httpx
-    except ImportError:
-        return (None, None)
-    try:
-        def _api_call(
-            method: str,
+        async def _api_call(
+            url: str,
             token: str,
             payload: dict[str, str | int | bool],
             *,
             allow_get_retry_on_invalid_arguments: bool = False,
-        ) -> tuple[int, dict, dict]:
-            headers = {"Authorization": f"Bearer {token}"}
-            # Slack Web API is form-encoded; JSON payloads can produce invalid_arguments on some methods.
-            r_local = httpx.post(
-                f"https://slack.com/api/{method}",
-                headers=headers,
-                data=payload,
-                timeout=10.0,
-            )
-            j_local = r_local.json()
+        ) -> tuple[int, dict, httpx.Headers]:
+            headers = _auth_headers(token)
+            for attempt in range(2):
+                await _wait_for_slack_method(url)
+                # Slack Web API is form-encoded; JSON payloads can produce invalid_arguments on some methods.
+                r_local = await http.post(
+                    url,
+                    headers=headers,
+                    data=payload,
+                    timeout=10.0,
+                )
+                if r_local.status_code != 429:
+                    break
+                delay = _note_slack_rate_limit(url, r_local.headers)
+                if attempt == 0:
+                    logger.info("fetch_message: %s rate limited, retrying in %.1fs", url, delay)
+            if r_local.status_code == 429:
+                return (r_local.status_code, {}, r_local.headers)
+            j_local = _json_loads(r_local.content)
             if (
                 allow_get_retry_on_invalid_arguments
                 and r_local.status_code == 200
@@ -292,53 +711,20 @@ def _fetch_message(
                 and j_local.get("error") == "invalid_arguments"
             ):
                 # Some workspaces/apps are picky about encoding on specific methods.
-                r_retry = httpx.get(
-                    f"https://slack.com/api/{method}",
+                r_retry = await http.get(
+                    url,
                     headers=headers,
                     params=payload,
                     timeout=10.0,
                 )
+                if r_retry.status_code == 429:
+                    _note_slack_rate_limit(url, r_retry.headers)
                 try:
-                    retry_headers = dict(getattr(r_retry, "headers", {}) or {})
-                    return (r_retry.status_code, r_retry.json(), retry_headers)
+                    return (r_retry.status_code, _json_loads(r_retry.content), r_retry.headers)
                 except Exception:
-                    retry_headers = dict(getattr(r_retry, "headers", {}) or {})
-                    return (r_retry.status_code, {}, retry_headers)
-            local_headers = dict(getattr(r_local, "headers", {}) or {})
-            return (r_local.status_code, j_local, local_headers)
-
-        # 1) Try channel history (works for top-level messages)
-        status_code, j, _ = _api_call(
-            "conversations.history",
-            config.SLACK_BOT_TOKEN,
-            {
-                "channel": channel_id,
-                "oldest": ts,
-                "latest": ts,
-                "inclusive": True,
-                "limit": 1,
-            },
-            allow_get_retry_on_invalid_arguments=True,
-        )
-        if status_code == 200 and j.get("ok"):
-            messages = j.get("messages") or []
-            if messages:
-                return ((messages[0].get("text") or "").strip(), ts)
-            # ok=True but empty: try replies (reaction may be on thread reply; Slack doesn't send thread_ts)
-            logger.info(
-                "fetch_message: history empty for ts=%s, trying conversations.replies (reaction on thread reply)",
-                ts,
-            )
-        elif status_code == 200 and not j.get("ok"):
-            logger.warning(
-                "fetch_message: conversations.history error channel=%s ts=%s error=%s",
-                channel_id,
-                ts,
-                j.get("error", "unknown"),
-            )
+                    return (r_retry.status_code, {}, r_retry.headers)
+            return (r_local.status_code, j_local, r_local.headers)
 
-        # 2) Try conversations.replies directly with the reacted message ts.
-        # Some workspaces accept reply ts anchors; if that fails, we fall back to parent discovery.
         ts_str = str(ts).strip()
         user_token = (config.SLACK_USER_TOKEN or "").strip()
         history_token = user_token or config.SLACK_BOT_TOKEN
@@ -369,7 +755,7 @@ def _fetch_message(
             except (TypeError, ValueError):
                 return False
 
-        def _scan_thread_for_target(
+        async def _scan_thread_for_target(
             anchor_ts: str, *, max_pages: int = 4
         ) -> tuple[str, str | None, str | None]:
             cursor = None
@@ -377,8 +763,8 @@ def _fetch_message(
                 payload = {"channel": channel_id, "ts": anchor_ts, "limit": _SLACK_REPLIES_LIMIT}
                 if cursor:
                     payload["cursor"] = cursor
-                status_code2, j2, headers2 = _api_call(
-                    "conversations.replies",
+                status_code2, j2, headers2 = await _api_call(
+                    _REPLIES_URL,
                     replies_token,
                     payload,
                     allow_get_retry_on_invalid_arguments=True,
@@ -413,22 +799,58 @@ def _fetch_message(
                     break
             return ("not_found", None, None)
 
-        direct_status, text, reply_thread_ts = _scan_thread_for_target(ts_str, max_pages=1)
+        # 1) Event provided the parent ts: the message is a thread reply, which never shows up in
+        # channel history, so go straight to its thread and stop there.
+        parent_ts = str(thread_ts).strip() if thread_ts else ""
+        if parent_ts and parent_ts != ts_str:
+            parent_status, text, reply_thread_ts = await _scan_thread_for_target(parent_ts)
+            if parent_status == "found" and text:
+                return (text, reply_thread_ts)
+            # The event named the parent thread; the direct and history-based lookups below
+            # would only query the same thread again with the same token.
+            logger.warning(
+                "fetch_message: ts=%s not resolved in parent thread %s (%s)", ts_str, parent_ts, parent_status
+            )
+            return (None, None)
+
+        # Otherwise try channel history (works for top-level messages).
+        status_code, j, _ = await _api_call(
+            _HISTORY_URL,
+            config.SLACK_BOT_TOKEN,
+            {
+                "channel": channel_id,
+                "oldest": ts,
+                "latest": ts,
+                "inclusive": True,
+                "limit": 1,
+            },
+            allow_get_retry_on_invalid_arguments=True,
+        )
+        if status_code == 200 and j.get("ok"):
+            messages = j.get("messages") or []
+            if messages:
+                return ((messages[0].get("text") or "").strip(), ts)
+            # ok=True but empty: try replies (reaction may be on thread reply; Slack doesn't send thread_ts)
+            logger.info(
+                "fetch_message: history empty for ts=%s, trying conversations.replies (reaction on thread reply)",
+                ts,
+            )
+        elif status_code == 200 and not j.get("ok"):
+            logger.warning(
+                "fetch_message: conversations.history error channel=%s ts=%s error=%s",
+                channel_id,
+                ts,
+                j.get("error", "unknown"),
+            )
+
+        # 2) Try conversations.replies directly with the reacted message ts.
+        # Some workspaces accept reply ts anchors; if that fails, we fall back to parent discovery.
+        direct_status, text, reply_thread_ts = await _scan_thread_for_target(ts_str, max_pages=1)
         if direct_status == "found" and text:
             return (text, reply_thread_ts)
         if direct_status == "rate_limited":
             return (None, None)
 
-        # If event provided parent ts, retry once with that parent anchor first.
-        if thread_ts:
-            parent_ts = str(thread_ts).strip()
-            if parent_ts and parent_ts != ts_str:
-                parent_status, text, reply_thread_ts = _scan_thread_for_target(parent_ts)
-                if parent_status == "found" and text:
-                    return (text, reply_thread_ts)
-                if parent_status == "rate_limited":
-                    return (None, None)
-
         # 3) Fallback: discover likely parent messages from history then resolve via replies(parent_ts).
         logger.info("fetch_message: direct replies lookup failed, starting parent discovery for ts=%s", ts_str)
         all_messages: list[dict] = []
@@ -441,8 +863,8 @@ def _fetch_message(
             }
             if history_cursor:
                 history_payload["cursor"] = history_cursor
-            status_code_h, j_history, history_headers = _api_call(
-                "conversations.history",
+            status_code_h, j_history, history_headers = await _api_call(
+                _HISTORY_URL,
                 history_token,
                 history_payload,
                 allow_get_retry_on_invalid_arguments=True,
@@ -480,9 +902,18 @@ def _fetch_message(
                     reply_count = int(msg.get("reply_count", 0) or 0)
                 except (TypeError, ValueError):
                     reply_count = 0
-                if reply_count > 0:
-                    parent_candidates.append(str(parent_ts).strip())
-            if not parent_candidates:
+                if reply_count <= 0:
+                    continue
+                # A thread whose last reply is older than the target cannot contain it.
+                latest_reply = msg.get("latest_reply")
+                if latest_reply and ts_float is not None:
+                    try:
+                        if float(latest_reply) < ts_float:
+                            continue
+                    except (TypeError, ValueError):
+                        pass
+                parent_candidates.append(str(parent_ts).strip())
+            if not parent_candidates and not any(msg.get("reply_count") for msg in all_messages):
                 parent_candidates = [str((msg.get("ts") or "")).strip() for msg in all_messages if msg.get("ts")]
             # Keep candidate set bounded; newest messages come first from history.
             parent_candidates = [p for p in parent_candidates if p][:30]
@@ -492,7 +923,7 @@ def _fetch_message(
                 len(all_messages),
             )
             for parent_ts in parent_candidates:
-                parent_status, text, reply_thread_ts = _scan_thread_for_target(parent_ts)
+                parent_status, text, reply_thread_ts = await _scan_thread_for_target(parent_ts)
                 if parent_status == "found" and text:
                     return (text, reply_thread_ts)
                 if parent_status == "rate_limited":
@@ -509,33 +940,24 @@ def _fetch_message(
         return (None, None)
 
 
-def _post_thread_reply(channel_id: str, thread_ts: str, text: str) -> bool:
+async def _post_thread_reply(channel_id: str, thread_ts: str, text: str) -> bool:
     """Post message to Slack as a thread reply. Returns True on success."""
     if not config.SLACK_BOT_TOKEN:
         logger.warning("SLACK_BOT_TOKEN not set; cannot post reply")
         return False
-    try:
-        import httpx
-    except ImportError:
-        logger.warning("httpx not installed; pip install httpx")
-        return False
-    url = "https://slack.com/api/chat.postMessage"
-    headers = {
-        "Authorization": f"Bearer {config.SLACK_BOT_TOKEN}",
-        "Content-Type": "application/json; charset=utf-8",
-    }
-    payload = {
+    payload = _json_dumps({
         "channel": channel_id,
         "thread_ts": thread_ts,
         "text": text,
-    }
+    })
     try:
-        with httpx.Client(timeout=15.0) as client:
-            r = client.post(url, headers=headers, json=payload)
+        r = await _get_http().post(
+            _POST_URL, headers=_json_headers(config.SLACK_BOT_TOKEN), content=payload
+        )
         if r.status_code != 200:
             logger.error("Slack API error: %s %s", r.status_code, r.text)
             return False
-        data = r.json()
+        data = _json_loads(r.content)
         if not data.get("ok"):
             logger.error("Slack API not ok: %s", data)
             return False
@@ -545,20 +967,116 @@ def _post_thread_reply(channel_id: str, thread_ts: str, text: str) -> bool:
         return False
 
 
+async def _process_translatable(channel_id: str, reply_thread_ts: str, text: str) -> bool:
+    """
+    Shared tail of every trigger: strip the preamble, translate (one DeepL batch) and post the
+    result as a thread reply. Returns True when a translation was posted.
+    """
+    text = _extract_content_to_translate(text)
+    if not text:
+        return False
+    translated = await _translate_headline_and_body(text)
+    if not translated:
+        return False
+    return await _post_thread_reply(channel_id, reply_thread_ts, translated)
+
+
+async def _translate_reaction(channel_id: str, message_ts: str, thread_ts: str | None) -> None:
+    """Fetch the reacted message (unless seen recently), translate it and post the translation as a thread reply."""
+    recent = _recent_messages.get((channel_id, message_ts))
+    if recent is not None:
+        text, reply_thread_ts = recent
+    else:
+        text, reply_thread_ts = await _fetch_message(channel_id, message_ts, thread_ts=thread_ts)
+    if not text:
+        logger.warning(
+            "reaction_added: could not fetch message channel=%s ts=%s (check fetch_message logs)",
+            channel_id,
+            message_ts,
+        )
+        return
+    # reply_thread_ts from _fetch_message (parent ts for threads, or message ts for channel messages)
+    if not reply_thread_ts:
+        reply_thread_ts = message_ts
+    if await _process_translatable(channel_id, reply_thread_ts, text):
+        logger.info("Posted translation (reaction) for channel=%s ts=%s", channel_id, message_ts)
+
+
+async def _translate_edit(
+    channel_id: str,
+    message_ts: str,
+    edited_message: dict,
+    previous_message: dict,
+) -> None:
+    """If the edited message carries the trigger emoji, post an updated translation."""
+    if not await _message_has_trigger_reaction(
+        channel_id,
+        str(message_ts),
+        config.REACTION_TRIGGER_EMOJI,
+        edited_message,
+        previous_message,
+    ):
+        logger.info(
+            "message_changed: trigger reaction %r not present channel=%s ts=%s; skipping",
+            config.REACTION_TRIGGER_EMOJI,
+            channel_id,
+            message_ts,
+        )
+        return
+
+    text = (edited_message.get("text") or "").strip()
+    if not text:
+        return
+    reply_thread_ts = (
+        edited_message.get("thread_ts")
+        or previous_message.get("thread_ts")
+        or message_ts
+    )
+    if await _process_translatable(channel_id, reply_thread_ts, text):
+        logger.info(
+            "Posted updated translation (message_changed) for channel=%s ts=%s",
+            channel_id,
+            message_ts,
+        )
+
+
+async def _translate_message(channel_id: str, ts: str, text: str) -> None:
+    """Translate a new channel message (all / prefix / mention trigger) and post it as a thread reply."""
+    # Only translate when trigger matches (all / prefix / mention)
+    text_to_translate = await _should_translate_and_strip(text)
+    if text_to_translate is None:
+        return
+    if await _process_translatable(channel_id, ts, text_to_translate):
+        logger.info("Posted translation for channel=%s ts=%s", channel_id, ts)
+
+
+async def _run_job(job: Callable[..., Awaitable[None]], *args: Any) -> None:
+    """Run a translation job after the ack; at most _MAX_ACTIVE_JOBS run at once."""
+    async with _job_slots:
+        try:
+            await job(*args)
+        except Exception as e:
+            logger.exception("%s failed: %s", job.__name__, e)
+
+
 @app.post("/slack/events")
-async def slack_events(request: Request) -> Response:
+async def slack_events(request: Request, background_tasks: BackgroundTasks) -> Response:
     """
     Slack Events API endpoint. Verifies signature, handles url_verification challenge,
     and on message events translates EN->DE and posts as thread reply.
+    Translation runs as a background task after the 200 ack, so Slack's 3s deadline
+    only covers verification and the cheap filters below.
     """
     # Need raw body for signature verification (before parsing JSON)
     body = await request.body()
     signature = request.headers.get("x-slack-signature")
     timestamp = request.headers.get("x-slack-request-timestamp")
 
+    if config.TRANSLATE_TRIGGER == "reaction" and not _REACTION_MODE_EVENTS.search(body):
+        return PlainTextResponse("OK", status_code=200)
+
     try:
-        import json
-        data = json.loads(body.decode("utf-8"))
+        data = _json_loads(body)
     except Exception as e:
         logger.warning("Invalid JSON body: %s", e)
         return PlainTextResponse("Bad Request", status_code=400)
@@ -568,7 +1086,7 @@ async def slack_events(request: Request) -> Response:
     if data.get("type") == "url_verification":
         challenge = data.get("challenge")
         if challenge is not None:
-            return JSONResponse(content={"challenge": challenge})
+            return Response(content=_json_dumps({"challenge": challenge}), media_type="application/json")
         return PlainTextResponse("Bad Request", status_code=400)
 
     # For all other requests, verify the signature
@@ -582,6 +1100,10 @@ async def slack_events(request: Request) -> Response:
 
     event = data.get("event") or {}
 
+    if event.get("type") in ("reaction_added", "reaction_removed"):
+        reacted = event.get("item") or {}
+        _reactions_cache.pop((reacted.get("channel"), reacted.get("ts")), None)
+
     # --- Reaction trigger: translate only when someone adds the trigger emoji to a message ---
     if event.get("type") == "reaction_added":
         raw_reaction = event.get("reaction") or ""
@@ -604,27 +1126,9 @@ async def slack_events(request: Request) -> Response:
             return PlainTextResponse("OK", status_code=200)
         if config.CHANNEL_IDS_LIST and channel_id not in config.CHANNEL_IDS_LIST:
             return PlainTextResponse("OK", status_code=200)
-        if _already_processed(channel_id, message_ts):
+        if await _already_processed(channel_id, message_ts):
             return PlainTextResponse("OK", status_code=200)
-        text, reply_thread_ts = _fetch_message(channel_id, message_ts, thread_ts=thread_ts)
-        if not text:
-            logger.warning(
-                "reaction_added: could not fetch message channel=%s ts=%s (check fetch_message logs)",
-                channel_id,
-                message_ts,
-            )
-            return PlainTextResponse("OK", status_code=200)
-        text = _extract_content_to_translate(text)
-        if not text:
-            return PlainTextResponse("OK", status_code=200)
-        translated = _translate_headline_and_body(text)
-        if not translated:
-            return PlainTextResponse("OK", status_code=200)
-        # reply_thread_ts from _fetch_message (parent ts for threads, or message ts for channel messages)
-        if not reply_thread_ts:
-            reply_thread_ts = message_ts
-        if _post_thread_reply(channel_id, reply_thread_ts, translated):
-            logger.info("Posted translation (reaction) for channel=%s ts=%s", channel_id, message_ts)
+        background_tasks.add_task(_run_job, _translate_reaction, channel_id, message_ts, thread_ts)
         return PlainTextResponse("OK", status_code=200)
 
     # --- Reaction trigger + edits: if message with trigger emoji gets edited, post updated translation ---
@@ -644,56 +1148,30 @@ async def slack_events(request: Request) -> Response:
             return PlainTextResponse("OK", status_code=200)
         if edited_message.get("bot_id") or previous_message.get("bot_id"):
             return PlainTextResponse("OK", status_code=200)
-
-        if not _message_has_trigger_reaction(
-            channel_id,
-            str(message_ts),
-            config.REACTION_TRIGGER_EMOJI,
-            edited_message,
-            previous_message,
-        ):
-            logger.info(
-                "message_changed: trigger reaction %r not present channel=%s ts=%s; skipping",
-                config.REACTION_TRIGGER_EMOJI,
+        edited_text = (edited_message.get("text") or "").strip()
+        if edited_text:
+            _remember_message(
                 channel_id,
                 message_ts,
+                edited_text,
+                edited_message.get("thread_ts") or previous_message.get("thread_ts") or message_ts,
             )
-            return PlainTextResponse("OK", status_code=200)
 
+        # Dedupe Slack retries of the same edit before scheduling any work for it.
         edit_marker = str(
             (edited_message.get("edited") or {}).get("ts") or event.get("event_ts") or ""
         ).strip()
-        if edit_marker and _already_processed(channel_id, f"{message_ts}:edit:{edit_marker}"):
-            return PlainTextResponse("OK", status_code=200)
-
-        text = (edited_message.get("text") or "").strip()
-        if not text:
-            return PlainTextResponse("OK", status_code=200)
-        text = _extract_content_to_translate(text)
-        if not text:
-            return PlainTextResponse("OK", status_code=200)
-        translated = _translate_headline_and_body(text)
-        if not translated:
+        if edit_marker and await _already_processed(channel_id, f"{message_ts}:edit:{edit_marker}"):
             return PlainTextResponse("OK", status_code=200)
 
-        reply_thread_ts = (
-            edited_message.get("thread_ts")
-            or previous_message.get("thread_ts")
-            or message_ts
+        background_tasks.add_task(
+            _run_job, _translate_edit, channel_id, message_ts, edited_message, previous_message
         )
-        if _post_thread_reply(channel_id, reply_thread_ts, translated):
-            logger.info(
-                "Posted updated translation (message_changed) for channel=%s ts=%s",
-                channel_id,
-                message_ts,
-            )
         return PlainTextResponse("OK", status_code=200)
 
     # --- Message trigger: translate on new message (all / prefix / mention) ---
     if event.get("type") != "message":
         return PlainTextResponse("OK", status_code=200)
-    if config.TRANSLATE_TRIGGER == "reaction":
-        return PlainTextResponse("OK", status_code=200)
 
     # Only process new user messages (no bot messages, no subtypes like channel_join)
     if event.get("bot_id") or event.get("subtype"):
@@ -709,29 +1187,16 @@ async def slack_events(request: Request) -> Response:
     if config.CHANNEL_IDS_LIST and channel_id not in config.CHANNEL_IDS_LIST:
         return PlainTextResponse("OK", status_code=200)
 
-    # Idempotency
-    if _already_processed(channel_id, ts):
-        return PlainTextResponse("OK", status_code=200)
-
-    # Only translate when trigger matches (all / prefix / mention)
-    text_to_translate = _should_translate_and_strip(text)
-    if text_to_translate is None:
-        return PlainTextResponse("OK", status_code=200)
-    text_to_translate = _extract_content_to_translate(text_to_translate)
-    if not text_to_translate:
+    # Reaction mode: only remember the message for a later trigger reaction
+    if config.TRANSLATE_TRIGGER == "reaction":
+        _remember_message(channel_id, ts, text, event.get("thread_ts") or ts)
         return PlainTextResponse("OK", status_code=200)
 
-    # Translate headline and body separately so the reply keeps them on two lines
-    translated = _translate_headline_and_body(text_to_translate)
-    if not translated:
+    # Idempotency
+    if await _already_processed(channel_id, ts):
         return PlainTextResponse("OK", status_code=200)
 
-    # Post as thread reply
-    if _post_thread_reply(channel_id, ts, translated):
-        logger.info("Posted translation for channel=%s ts=%s", channel_id, ts)
-    else:
-        logger.error("Failed to post translation for channel=%s ts=%s", channel_id, ts)
-
+    background_tasks.add_task(_run_job, _translate_message, channel_id, ts, text)
     return PlainTextResponse("OK", status_code=200)
 
 
@@ -745,7 +1210,9 @@ def run() -> None:
     """Run the server (e.g. for local development)."""
     import uvicorn
     port = int(os.environ.get("PORT", "8000"))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvloop (libuv event loop) + httptools parser; uvloop is not available on Windows.
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    uvicorn.run(app, host="0.0.0.0", port=port, loop=loop, http="httptools")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,19 @@
 """Verify that incoming HTTP requests are signed by Slack (HMAC-SHA256)."""
 
-import hashlib
 import hmac
 import time
+from functools import lru_cache
 from typing import Optional
 
 from . import config
 
 
+@lru_cache(maxsize=2)
+def _secret_bytes(secret: str) -> bytes:
+    """Signing secret as bytes, encoded once instead of on every request."""
+    return secret.encode("utf-8")
+
+
 def verify_slack_request(
     body: bytes,
     signature: Optional[str],
@@ -27,10 +33,14 @@ def verify_slack_request(
     max_age = max_age_seconds if max_age_seconds is not None else config.SLACK_REQUEST_MAX_AGE_SECONDS
     if abs(time.time() - ts) > max_age:
         return False
-    sig_basestring = f"v0:{timestamp}:".encode("utf-8") + body
-    computed = "v0=" + hmac.new(
-        config.SLACK_SIGNING_SECRET.encode("utf-8"),
-        sig_basestring,
-        hashlib.sha256,
-    ).hexdigest()
-    return hmac.compare_digest(computed, signature)
+    # Feed "v0:{timestamp}:" and the body separately so the body is never copied into a new buffer.
+    # A "sha256" digestmod goes straight to OpenSSL's HMAC implementation.
+    mac = hmac.new(
+        _secret_bytes(config.SLACK_SIGNING_SECRET),
+        f"v0:{timestamp}:".encode("utf-8"),
+        "sha256",
+    )
+    mac.update(body)
+    computed = b"v0=" + mac.hexdigest().encode("ascii")
+    # Compare bytes: compare_digest rejects non-ASCII str, and the header is client-controlled.
+    return hmac.compare_digest(computed, signature.encode("utf-8"))
@@ -1,14 +1,139 @@
 """Translate text using DeepL; only treat as success when source is English."""
 
 import logging
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
 from typing import Optional
 
 from . import config
 
+try:
+    import deepl
+except ImportError:  # translate_* log a warning and return None
+    deepl = None
+
 logger = logging.getLogger(__name__)
 
 # Only post translation to Slack when detected source is English
 SOURCE_LANG_FILTER = "EN"
+# Spellings of the source-language code treated as English
+_SOURCE_LANG_CODES = frozenset({SOURCE_LANG_FILTER, SOURCE_LANG_FILTER.lower()})
+
+# Cheap pre-check so clearly German messages don't cost a DeepL round-trip just to be rejected.
+# Only words that are not also English count; they must be a real share of the text (English
+# messages quoting "Das Boot" or "ein Prosit" still go to DeepL) and outnumber English function words.
+_GERMAN_HINT_WORDS = re.compile(
+    r"\b(?:und|nicht|ist|der|das|ein|eine|einen|mit|für|auch|wir|ich|sind|wird|oder|aber|noch|bitte|danke)\b",
+    re.IGNORECASE,
+)
+_ENGLISH_HINT_WORDS = re.compile(
+    r"\b(?:the|and|is|are|to|of|with|for|you|we|this|that|please|it)\b", re.IGNORECASE
+)
+_WORD = re.compile(r"\w+")
+_GERMAN_MIN_HINTS = 3
+_GERMAN_MIN_SHARE = 0.3
+
+
+def _looks_german(text: str) -> bool:
+    german = len(_GERMAN_HINT_WORDS.findall(text))
+    if german < _GERMAN_MIN_HINTS:
+        return False
+    if german < _GERMAN_MIN_SHARE * len(_WORD.findall(text)):
+        return False
+    return german > len(_ENGLISH_HINT_WORDS.findall(text))
+
+
+# LRU of recent DeepL answers per segment (stripped, NFC-normalized text -> German text, or None when
+# the source was not English). Slack repeats a lot (re-reactions, edits, templated posts); errors are
+# not cached. A couple of thousand entries covers the repetition seen in practice.
+_CACHE_SIZE = 2048
+_cache: OrderedDict[str, Optional[str]] = OrderedDict()
+_cache_lock = threading.Lock()  # batches run in worker threads (asyncio.to_thread)
+_MISS = object()
+
+
+# DeepL accepts at most 50 texts per translate request
+_MAX_TEXTS_PER_REQUEST = 50
+
+# One Translator per API key, shared by all calls (and worker threads) so its HTTP session keeps
+# connections to DeepL alive instead of a new TCP+TLS handshake per translation.
+_translator = None
+_translator_key = ""
+_translator_lock = threading.Lock()
+
+
+def _get_translator():
+    global _translator, _translator_key
+    with _translator_lock:
+        if _translator is None or _translator_key != config.DEEPL_API_KEY:
+            _translator = deepl.Translator(config.DEEPL_API_KEY)
+            _translator_key = config.DEEPL_API_KEY
+        return _translator
+
+
+def _drop_translator(translator) -> None:
+    """Forget a Translator whose key was rejected so the next call builds a fresh one."""
+    global _translator
+    with _translator_lock:
+        if _translator is translator:
+            _translator = None
+
+
+def _cache_key(stripped: str) -> str:
+    # Slack clients differ in composed vs decomposed accents; same text, same key.
+    return unicodedata.normalize("NFC", stripped)
+
+
+def _cache_store(items: list[tuple[str, Optional[str]]]) -> None:
+    with _cache_lock:
+        for key, value in items:
+            _cache[key] = value
+            _cache.move_to_end(key)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def translation_cache_key(text: str) -> str:
+    """Normalized form of text under which its translation is cached (shared caches should use it too)."""
+    return _cache_key(text.strip())
+
+
+def cached_translations(texts: list[str]) -> dict[int, Optional[str]]:
+    """Look texts up in the in-memory LRU; returns {index: translation} for the hits only."""
+    hits: dict[int, Optional[str]] = {}
+    with _cache_lock:
+        for i, t in enumerate(texts):
+            key = translation_cache_key(t) if t else ""
+            if not key:
+                hits[i] = None
+                continue
+            hit = _cache.get(key, _MISS)
+            if hit is not _MISS:
+                _cache.move_to_end(key)
+                hits[i] = hit
+    return hits
+
+
+def store_translations(pairs: list[tuple[str, Optional[str]]]) -> None:
+    """Remember (text, translation) pairs obtained elsewhere, e.g. from a shared Redis cache."""
+    _cache_store([(translation_cache_key(t), translated) for t, translated in pairs])
+
+
+def clear_translation_cache() -> None:
+    """Forget all cached translations (e.g. after changing the DeepL account or in tests)."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _english_result_text(result) -> Optional[str]:
+    """Return the translated text of a DeepL result, or None if its detected source is not English."""
+    detected = result.detected_source_lang
+    if detected is not None and detected not in _SOURCE_LANG_CODES:
+        logger.debug("Skipping translation: detected source %s is not EN", detected)
+        return None
+    return result.text
 
 
 def translate_en_to_de(text: str) -> Optional[str]:
@@ -17,32 +142,52 @@ def translate_en_to_de(text: str) -> Optional[str]:
     when the detected source language is English (SOURCE_LANG_FILTER).
     Returns None if not English or on error.
     """
-    if not text or not text.strip():
-        return None
+    return translate_en_to_de_batch([text])[0]
+
+
+def translate_en_to_de_batch(texts: list[str]) -> list[Optional[str]]:
+    """
+    Translate several texts to German in a single DeepL request (one round-trip per 50 texts).
+    Recently seen texts are answered from an in-memory LRU and not sent again.
+    Returns one entry per input, filtered like translate_en_to_de: None for empty
+    input, non-English source, or on error.
+    """
+    translated: list[Optional[str]] = [None] * len(texts)
+    pending: list[tuple[int, str, str]] = []
+    with _cache_lock:
+        for i, t in enumerate(texts):
+            stripped = t.strip() if t else ""
+            if not stripped:
+                continue
+            key = _cache_key(stripped)
+            hit = _cache.get(key, _MISS)
+            if hit is _MISS:
+                pending.append((i, stripped, key))
+            else:
+                _cache.move_to_end(key)
+                translated[i] = hit
+    if pending:
+        pending = [p for p in pending if not _looks_german(p[1])]
+    if not pending:
+        return translated
     if not config.DEEPL_API_KEY:
         logger.warning("DEEPL_API_KEY not set; skipping translation")
-        return None
-    try:
-        import deepl
-    except ImportError:
+        return translated
+    if deepl is None:
         logger.warning("deepl package not installed; pip install deepl")
-        return None
+        return translated
+    translator = None
     try:
-        translator = deepl.Translator(config.DEEPL_API_KEY)
-        result = translator.translate_text(text.strip(), target_lang="DE")
-        # Single string returns one result; list returns list of results
-        if hasattr(result, "__iter__") and not isinstance(result, str):
-            results = list(result)
-            if not results:
-                return None
-            first = results[0]
-        else:
-            first = result
-        detected = getattr(first, "detected_source_lang", None)
-        if detected is not None and str(detected).upper() != SOURCE_LANG_FILTER:
-            logger.debug("Skipping translation: detected source %s is not EN", detected)
-            return None
-        return getattr(first, "text", None) or str(first)
+        translator = _get_translator()
+        for start in range(0, len(pending), _MAX_TEXTS_PER_REQUEST):
+            chunk = pending[start : start + _MAX_TEXTS_PER_REQUEST]
+            results = translator.translate_text([t for _, t, _ in chunk], target_lang="DE")
+            for (i, _, _), result in zip(chunk, results):
+                translated[i] = _english_result_text(result)
+            _cache_store([(key, translated[i]) for i, _, key in chunk])
+    except deepl.AuthorizationException as e:
+        _drop_translator(translator)
+        logger.error("DeepL rejected the API key: %s", e)
     except Exception as e:
         logger.exception("DeepL translation failed: %s", e)
-        return None
+    return translated
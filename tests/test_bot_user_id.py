@@ -0,0 +1,73 @@
+"""
+Tests for _get_bot_user_id: auth.test lookup cached in memory and on disk across restarts.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+import slack_translate_bot.main as main_mod
+
+
+@pytest.fixture(autouse=True)
+def isolated_bot_id_cache(monkeypatch, tmp_path):
+    """Fresh in-memory state and a private temp dir for the on-disk cache."""
+    monkeypatch.setattr(main_mod, "_bot_user_id", None)
+    monkeypatch.setattr(main_mod, "_bot_mention", None)
+    monkeypatch.setattr(main_mod.tempfile, "gettempdir", lambda: str(tmp_path))
+
+
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+@patch("slack_translate_bot.main.config")
+def test_bot_user_id_fetched_once_and_written_to_disk(mock_config, mock_post):
+    """First lookup calls auth.test and persists the ID for later workers."""
+    mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
+    mock_post.return_value = httpx.Response(200, json={"ok": True, "user_id": "UBOT"})
+
+    assert asyncio.run(main_mod._get_bot_user_id()) == "UBOT"
+    assert asyncio.run(main_mod._get_bot_user_id()) == "UBOT"
+    assert mock_post.call_count == 1
+    assert main_mod._read_cached_bot_user_id("xoxb-fake") == "UBOT"
+
+
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+@patch("slack_translate_bot.main.config")
+def test_bot_user_id_read_from_disk_after_restart(mock_config, mock_post):
+    """A fresh process finds the cached ID on disk and skips auth.test."""
+    mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
+    main_mod._write_cached_bot_user_id("xoxb-fake", "UBOT")
+
+    assert asyncio.run(main_mod._get_bot_user_id()) == "UBOT"
+    mock_post.assert_not_called()
+
+
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+@patch("slack_translate_bot.main.config")
+def test_bot_user_id_read_from_redis_and_written_to_disk(mock_config, mock_post, monkeypatch):
+    """With Redis configured, another instance's cached ID is reused and auth.test is skipped."""
+    mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
+    fake_redis = AsyncMock()
+    fake_redis.get.return_value = b"UBOT"
+    monkeypatch.setattr(main_mod, "_get_redis", lambda: fake_redis)
+
+    assert asyncio.run(main_mod._get_bot_user_id()) == "UBOT"
+    mock_post.assert_not_called()
+    assert main_mod._read_cached_bot_user_id("xoxb-fake") == "UBOT"
+
+
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+@patch("slack_translate_bot.main.config")
+def test_invalid_cached_bot_user_id_is_ignored(mock_config, mock_post, monkeypatch):
+    """Garbage in the disk or Redis cache is treated as a miss; auth.test is called and the cache fixed."""
+    mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
+    main_mod._write_cached_bot_user_id("xoxb-fake", "<html>502 Bad Gateway")
+    fake_redis = AsyncMock()
+    fake_redis.get.return_value = b"\x00garbage"
+    monkeypatch.setattr(main_mod, "_get_redis", lambda: fake_redis)
+    mock_post.return_value = httpx.Response(200, json={"ok": True, "user_id": "UBOT"})
+
+    assert asyncio.run(main_mod._get_bot_user_id()) == "UBOT"
+    assert mock_post.call_count == 1
+    assert main_mod._read_cached_bot_user_id("xoxb-fake") == "UBOT"
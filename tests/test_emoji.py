@@ -42,3 +42,25 @@ def test_no_emoji_unchanged():
     out, shortcodes = _replace_slack_emojis_for_translation(text)
     assert out == text
     assert shortcodes == []
+
+
+def test_hyphenated_and_skin_tone_shortcodes_preserved():
+    """Shortcodes with hyphens (and skin-tone suffixes) are masked like any other."""
+    text = "Release :t-rex: done :+1::skin-tone-2:"
+    out, shortcodes = _replace_slack_emojis_for_translation(text)
+    assert shortcodes == [":t-rex:", ":+1:", ":skin-tone-2:"]
+    assert "t-rex" not in out and "skin-tone" not in out
+    assert _restore_slack_emojis(out, shortcodes) == text
+
+
+def test_restore_keeps_unknown_placeholder():
+    """A placeholder index without a shortcode is left as is instead of raising."""
+    assert _restore_slack_emojis("Hi :EMOJISLACK0: :EMOJISLACK7:", [":wave:"]) == "Hi :wave: :EMOJISLACK7:"
+
+
+def test_time_ranges_are_not_treated_as_emoji():
+    """Times like 10:30-11:00 stay as text so DeepL can localize them."""
+    text = "Standup 10:30-11:00 today, 9:15-9:45 tomorrow :coffee:"
+    out, shortcodes = _replace_slack_emojis_for_translation(text)
+    assert shortcodes == [":coffee:"]
+    assert "10:30-11:00" in out and "9:15-9:45" in out
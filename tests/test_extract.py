@@ -101,6 +101,13 @@ def test_extract_case_insensitive():
     assert "NESN advances" in got
 
 
+def test_extract_phrases_without_common_ending(monkeypatch):
+    """Phrases that don't share a final character still match (no substring pre-check)."""
+    monkeypatch.setattr(config, "EXTRACT_PHRASES_LIST", ["Translate please", "the following:"])
+    assert _extract_content_to_translate("Translate please Gold rallies") == "Gold rallies"
+    assert _extract_content_to_translate("No preamble here") == "No preamble here"
+
+
 # --- _split_headline_body: headline and body stay on separate lines after translation ---
 
 
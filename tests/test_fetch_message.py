@@ -2,27 +2,35 @@
 Tests for _fetch_message: channel messages and thread replies.
 """
 
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
+import slack_translate_bot.main as main_mod
 from slack_translate_bot.main import _fetch_message
 
 
-@patch("httpx.post")
-@patch("httpx.get")
+@pytest.fixture(autouse=True)
+def clear_rate_limits():
+    main_mod._slack_next_allowed.clear()
+    yield
+    main_mod._slack_next_allowed.clear()
+
+
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+@patch("httpx.AsyncClient.get", new_callable=AsyncMock)
 @patch("slack_translate_bot.main.config")
 def test_fetch_message_from_history(mock_config, mock_get, mock_post):
     """Channel message is fetched via conversations.history."""
     mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = {"ok": True, "messages": []}
-    mock_post.return_value.status_code = 200
-    mock_post.return_value.json.return_value = {
+    mock_get.return_value = httpx.Response(200, json={"ok": True, "messages": []})
+    mock_post.return_value = httpx.Response(200, json={
         "ok": True,
         "messages": [{"ts": "123.0", "text": "Hello world"}],
-    }
-    text, reply_ts = _fetch_message("C123", "123.0")
+    })
+    text, reply_ts = asyncio.run(_fetch_message("C123", "123.0"))
     assert text == "Hello world"
     assert reply_ts == "123.0"
     mock_post.assert_called_once()
@@ -31,28 +39,24 @@ def test_fetch_message_from_history(mock_config, mock_get, mock_post):
     assert "oldest" in call_data  # history
 
 
-@patch("httpx.post")
-@patch("httpx.get")
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+@patch("httpx.AsyncClient.get", new_callable=AsyncMock)
 @patch("slack_translate_bot.main.config")
 def test_fetch_message_from_replies_when_not_in_history(mock_config, mock_get, mock_post):
     """When message is not in channel history, fetch it directly via conversations.replies(ts)."""
     mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
     mock_config.SLACK_USER_TOKEN = "xoxp-fake"
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = {"ok": True, "messages": []}
+    mock_get.return_value = httpx.Response(200, json={"ok": True, "messages": []})
     # Call 1: history (oldest/latest) -> empty. Call 2: replies(ts) -> reply message.
-    history_empty = type("R", (), {"status_code": 200, "json": lambda *a, **k: {"ok": True, "messages": []}})()
-    replies_resp = type("R", (), {
-        "status_code": 200,
-        "json": lambda *a, **k: {
-            "ok": True,
-            "messages": [
-                {"ts": "456.0", "thread_ts": "123.0", "text": "Thread reply to translate"},
-            ],
-        },
-    })()
+    history_empty = httpx.Response(200, json={"ok": True, "messages": []})
+    replies_resp = httpx.Response(200, json={
+        "ok": True,
+        "messages": [
+            {"ts": "456.0", "thread_ts": "123.0", "text": "Thread reply to translate"},
+        ],
+    })
     mock_post.side_effect = [history_empty, replies_resp]
-    text, reply_ts = _fetch_message("C123", "456.0")
+    text, reply_ts = asyncio.run(_fetch_message("C123", "456.0"))
     assert text == "Thread reply to translate"
     assert reply_ts == "123.0"
     assert mock_post.call_count == 2
@@ -63,38 +67,28 @@ def test_fetch_message_from_replies_when_not_in_history(mock_config, mock_get, m
     assert replies_call.kwargs["headers"]["Authorization"] == "Bearer xoxp-fake"
 
 
-@patch("httpx.post")
-@patch("httpx.get")
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+@patch("httpx.AsyncClient.get", new_callable=AsyncMock)
 @patch("slack_translate_bot.main.config")
 def test_fetch_message_falls_back_to_parent_discovery_on_invalid_arguments(mock_config, mock_get, mock_post):
     """When replies(reply_ts) fails, resolve parent via history and fetch from replies(parent_ts)."""
     mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
     mock_config.SLACK_USER_TOKEN = "xoxp-fake"
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = {"ok": False, "error": "invalid_arguments"}
-
-    history_empty = type("R", (), {"status_code": 200, "json": lambda *a, **k: {"ok": True, "messages": []}})()
-    replies_invalid = type("R", (), {
-        "status_code": 200,
-        "json": lambda *a, **k: {"ok": False, "error": "invalid_arguments"},
-    })()
-    history_parents = type("R", (), {
-        "status_code": 200,
-        "json": lambda *a, **k: {"ok": True, "messages": [{"ts": "123.0", "reply_count": 3}]},
-    })()
-    replies_parent = type("R", (), {
-        "status_code": 200,
-        "json": lambda *a, **k: {
-            "ok": True,
-            "messages": [
-                {"ts": "123.0", "text": "Parent"},
-                {"ts": "456.0", "thread_ts": "123.0", "text": "Thread reply via fallback"},
-            ],
-        },
-    })()
+    mock_get.return_value = httpx.Response(200, json={"ok": False, "error": "invalid_arguments"})
+
+    history_empty = httpx.Response(200, json={"ok": True, "messages": []})
+    replies_invalid = httpx.Response(200, json={"ok": False, "error": "invalid_arguments"})
+    history_parents = httpx.Response(200, json={"ok": True, "messages": [{"ts": "123.0", "reply_count": 3}]})
+    replies_parent = httpx.Response(200, json={
+        "ok": True,
+        "messages": [
+            {"ts": "123.0", "text": "Parent"},
+            {"ts": "456.0", "thread_ts": "123.0", "text": "Thread reply via fallback"},
+        ],
+    })
     mock_post.side_effect = [history_empty, replies_invalid, history_parents, replies_parent]
 
-    text, reply_ts = _fetch_message("C123", "456.0")
+    text, reply_ts = asyncio.run(_fetch_message("C123", "456.0"))
     assert text == "Thread reply via fallback"
     assert reply_ts == "123.0"
     assert mock_get.call_count >= 1
@@ -109,9 +103,101 @@ def test_fetch_message_falls_back_to_parent_discovery_on_invalid_arguments(mock_
     assert replies_fallback_call.kwargs["data"].get("limit") == 15
 
 
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+@patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+@patch("slack_translate_bot.main.config")
+def test_fetch_message_with_thread_ts_skips_history(mock_config, mock_get, mock_post):
+    """When the event carries the parent thread_ts, go straight to conversations.replies(parent)."""
+    mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
+    mock_config.SLACK_USER_TOKEN = "xoxp-fake"
+    mock_post.return_value = httpx.Response(200, json={
+        "ok": True,
+        "messages": [
+            {"ts": "123.0", "text": "Parent"},
+            {"ts": "456.0", "thread_ts": "123.0", "text": "Thread reply"},
+        ],
+    })
+
+    text, reply_ts = asyncio.run(_fetch_message("C123", "456.0", thread_ts="123.0"))
+    assert text == "Thread reply"
+    assert reply_ts == "123.0"
+    mock_post.assert_called_once()
+    assert mock_post.call_args.args[0] == "https://slack.com/api/conversations.replies"
+    assert mock_post.call_args.kwargs["data"].get("ts") == "123.0"
+    mock_get.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "replies_json",
+    [
+        {"ok": True, "messages": [{"ts": "123.0", "text": "Parent"}]},  # not_found
+        {"ok": False, "error": "thread_not_found"},  # error
+    ],
+)
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+@patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+@patch("slack_translate_bot.main.config")
+def test_fetch_message_with_thread_ts_stops_when_parent_thread_fails(mock_config, mock_get, mock_post, replies_json):
+    """If the named parent thread doesn't yield the message, no history/replies lookups follow."""
+    mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
+    mock_config.SLACK_USER_TOKEN = "xoxp-fake"
+    mock_post.return_value = httpx.Response(200, json=replies_json)
+
+    assert asyncio.run(_fetch_message("C123", "456.0", thread_ts="123.0")) == (None, None)
+    mock_post.assert_called_once()
+    assert mock_post.call_args.args[0] == "https://slack.com/api/conversations.replies"
+    mock_get.assert_not_called()
+
+
 @patch("slack_translate_bot.main.config")
 def test_fetch_message_returns_none_without_token(mock_config):
     """Returns None when no token is set."""
     mock_config.SLACK_BOT_TOKEN = ""
     mock_config.SLACK_USER_TOKEN = ""
-    assert _fetch_message("C123", "123.0") == (None, None)
+    assert asyncio.run(_fetch_message("C123", "123.0")) == (None, None)
+
+
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+@patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+@patch("slack_translate_bot.main.config")
+def test_parent_discovery_skips_threads_that_ended_before_target(mock_config, mock_get, mock_post):
+    """Parents whose latest_reply is older than the reacted ts are not scanned."""
+    mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
+    mock_config.SLACK_USER_TOKEN = "xoxp-fake"
+    mock_get.return_value = httpx.Response(200, json={"ok": False, "error": "invalid_arguments"})
+
+    history_empty = httpx.Response(200, json={"ok": True, "messages": []})
+    replies_invalid = httpx.Response(200, json={"ok": False, "error": "invalid_arguments"})
+    history_parents = httpx.Response(200, json={
+        "ok": True,
+        "messages": [
+            {"ts": "400.0", "reply_count": 2, "latest_reply": "410.0"},
+            {"ts": "123.0", "reply_count": 3, "latest_reply": "500.0"},
+        ],
+    })
+    replies_parent = httpx.Response(200, json={
+        "ok": True,
+        "messages": [{"ts": "456.0", "thread_ts": "123.0", "text": "Thread reply"}],
+    })
+    mock_post.side_effect = [history_empty, replies_invalid, history_parents, replies_parent]
+
+    text, reply_ts = asyncio.run(_fetch_message("C123", "456.0"))
+    assert (text, reply_ts) == ("Thread reply", "123.0")
+    assert mock_post.call_count == 4
+    assert mock_post.call_args_list[3].kwargs["data"].get("ts") == "123.0"
+
+
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+@patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+@patch("slack_translate_bot.main.config")
+def test_fetch_message_retries_once_after_rate_limit(mock_config, mock_get, mock_post):
+    """A 429 records Retry-After for that method and the call is retried once after it."""
+    mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
+    mock_post.side_effect = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"ok": True, "messages": [{"ts": "123.0", "text": "Hello world"}]}),
+    ]
+    text, reply_ts = asyncio.run(_fetch_message("C123", "123.0"))
+    assert (text, reply_ts) == ("Hello world", "123.0")
+    assert mock_post.call_count == 2
+    assert main_mod._HISTORY_URL in main_mod._slack_next_allowed
@@ -0,0 +1,112 @@
+"""
+Tests for the retry/idempotency store (memory and Redis backends).
+"""
+
+import asyncio
+import sys
+import time
+import types
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+import slack_translate_bot.main as main_mod
+from slack_translate_bot.main import app
+
+
+@pytest.fixture(autouse=True)
+def clear_processed_cache():
+    main_mod._processed.clear()
+    yield
+    main_mod._processed.clear()
+
+
+def test_memory_backend_dedupes():
+    assert asyncio.run(main_mod._already_processed("C1", "1.0")) is False
+    assert asyncio.run(main_mod._already_processed("C1", "1.0")) is True
+    assert asyncio.run(main_mod._already_processed("C1", "2.0")) is False
+
+
+def test_redis_backend_uses_set_nx(monkeypatch):
+    fake = AsyncMock()
+    fake.set.side_effect = [True, None]
+    monkeypatch.setattr(main_mod, "_get_redis", lambda: fake)
+    monkeypatch.setattr(main_mod.config, "IDEMPOTENCY_TTL_SECONDS", 60)
+
+    assert asyncio.run(main_mod._already_processed("C1", "1.0")) is False
+    assert asyncio.run(main_mod._already_processed("C1", "1.0")) is True
+    fake.set.assert_awaited_with("idem:C1:1.0", "1", nx=True, ex=60)
+    assert not main_mod._processed
+
+
+def test_redis_error_falls_back_to_memory(monkeypatch):
+    fake = AsyncMock()
+    fake.set.side_effect = ConnectionError("down")
+    monkeypatch.setattr(main_mod, "_get_redis", lambda: fake)
+
+    assert asyncio.run(main_mod._already_processed("C1", "1.0")) is False
+    assert asyncio.run(main_mod._already_processed("C1", "1.0")) is True
+
+
+def test_memory_backend_forgets_old_and_excess_keys(monkeypatch):
+    monkeypatch.setattr(main_mod, "_MAX_IDEMPOTENCY_SIZE", 2)
+    monkeypatch.setattr(main_mod.config, "IDEMPOTENCY_TTL_SECONDS", 3600)
+    for ts in ("1.0", "2.0", "3.0"):
+        assert asyncio.run(main_mod._already_processed("C1", ts)) is False
+    assert list(main_mod._processed) == [("C1", "2.0"), ("C1", "3.0")]
+
+    # With a zero TTL, earlier entries no longer count as processed
+    monkeypatch.setattr(main_mod.config, "IDEMPOTENCY_TTL_SECONDS", 0)
+    assert asyncio.run(main_mod._already_processed("C1", "2.0")) is False
+    assert list(main_mod._processed) == [("C1", "2.0")]
+
+
+def test_redis_client_uses_short_socket_timeouts(monkeypatch):
+    """The Redis client fails fast so an unreachable server can't delay the ack."""
+    fake_redis_asyncio = types.ModuleType("redis.asyncio")
+    fake_redis_asyncio.Redis = MagicMock()
+    fake_redis = types.ModuleType("redis")
+    fake_redis.asyncio = fake_redis_asyncio
+    monkeypatch.setitem(sys.modules, "redis", fake_redis)
+    monkeypatch.setitem(sys.modules, "redis.asyncio", fake_redis_asyncio)
+    monkeypatch.setattr(main_mod, "_redis", None)
+    monkeypatch.setattr(main_mod.config, "IDEMPOTENCY_BACKEND", "redis")
+    monkeypatch.setattr(main_mod.config, "REDIS_URL", "redis://redis.invalid:6379/0")
+
+    assert main_mod._get_redis() is fake_redis_asyncio.Redis.from_url.return_value
+    kwargs = fake_redis_asyncio.Redis.from_url.call_args.kwargs
+    assert 0 < kwargs["socket_connect_timeout"] <= 0.5
+    assert 0 < kwargs["socket_timeout"] <= 0.5
+
+
+@patch("slack_translate_bot.main._run_job", new_callable=AsyncMock)
+@patch("slack_translate_bot.main.verify_slack_request", return_value=True)
+@patch("slack_translate_bot.main.config")
+def test_redis_timeout_still_acks_quickly_via_memory(mock_config, _mock_verify, mock_run_job, monkeypatch):
+    """A Redis timeout falls back to the memory store and the event is still acked and deduped."""
+    mock_config.TRANSLATE_TRIGGER = "all"
+    mock_config.IDEMPOTENCY_TTL_SECONDS = 3600
+    mock_config.CHANNEL_IDS_LIST = []
+
+    async def timed_out(*args, **kwargs):
+        await asyncio.sleep(main_mod._REDIS_TIMEOUT_SECONDS)
+        raise TimeoutError("Timeout reading from socket")
+
+    fake = AsyncMock()
+    fake.set.side_effect = timed_out
+    monkeypatch.setattr(main_mod, "_get_redis", lambda: fake)
+    payload = {
+        "type": "event_callback",
+        "event": {"type": "message", "channel": "C1", "ts": "1.0", "text": "Hello"},
+    }
+    headers = {"x-slack-signature": "v0=fake", "x-slack-request-timestamp": "1700000000"}
+
+    with TestClient(app) as client:
+        start = time.monotonic()
+        assert client.post("/slack/events", json=payload, headers=headers).status_code == 200
+        assert time.monotonic() - start < 1.0
+        assert client.post("/slack/events", json=payload, headers=headers).status_code == 200
+
+    assert ("C1", "1.0") in main_mod._processed
+    assert mock_run_job.await_count == 1
@@ -2,8 +2,10 @@
 Tests for reaction-trigger edit handling (message_changed).
 """
 
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
@@ -14,8 +16,12 @@ from slack_translate_bot.main import app
 @pytest.fixture(autouse=True)
 def clear_processed_cache():
     main_mod._processed.clear()
+    main_mod._recent_messages.clear()
+    main_mod._reactions_cache.clear()
     yield
     main_mod._processed.clear()
+    main_mod._recent_messages.clear()
+    main_mod._reactions_cache.clear()
 
 
 def _message_changed_payload(*, reactions):
@@ -54,6 +60,7 @@ def test_message_changed_with_trigger_reaction_posts_updated_translation(
     mock_config, _mock_verify, mock_translate, mock_post_reply
 ):
     mock_config.TRANSLATE_TRIGGER = "reaction"
+    mock_config.IDEMPOTENCY_TTL_SECONDS = 3600
     mock_config.REACTION_TRIGGER_EMOJI = "de"
     mock_config.CHANNEL_IDS_LIST = []
 
@@ -81,6 +88,7 @@ def test_message_changed_without_trigger_reaction_is_skipped(
     mock_config, _mock_verify, mock_translate, mock_post_reply
 ):
     mock_config.TRANSLATE_TRIGGER = "reaction"
+    mock_config.IDEMPOTENCY_TTL_SECONDS = 3600
     mock_config.REACTION_TRIGGER_EMOJI = "de"
     mock_config.CHANNEL_IDS_LIST = []
 
@@ -108,6 +116,7 @@ def test_message_changed_same_edit_event_is_idempotent(
     mock_config, _mock_verify, _mock_translate, mock_post_reply
 ):
     mock_config.TRANSLATE_TRIGGER = "reaction"
+    mock_config.IDEMPOTENCY_TTL_SECONDS = 3600
     mock_config.REACTION_TRIGGER_EMOJI = "de"
     mock_config.CHANNEL_IDS_LIST = []
 
@@ -135,7 +144,7 @@ def test_message_changed_same_edit_event_is_idempotent(
     assert mock_post_reply.call_count == 1
 
 
-@patch("httpx.post")
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
 @patch("slack_translate_bot.main._post_thread_reply", return_value=True)
 @patch("slack_translate_bot.main._translate_headline_and_body", return_value="Hallo Welt")
 @patch("slack_translate_bot.main.verify_slack_request", return_value=True)
@@ -144,15 +153,15 @@ def test_message_changed_fetches_reactions_when_not_in_payload(
     mock_config, _mock_verify, _mock_translate, mock_post_reply, mock_http_post
 ):
     mock_config.TRANSLATE_TRIGGER = "reaction"
+    mock_config.IDEMPOTENCY_TTL_SECONDS = 3600
     mock_config.REACTION_TRIGGER_EMOJI = "de"
     mock_config.CHANNEL_IDS_LIST = []
     mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
-    mock_http_post.return_value.status_code = 200
-    mock_http_post.return_value.json.return_value = {
+    mock_http_post.return_value = httpx.Response(200, json={
         "ok": True,
         "type": "message",
         "message": {"reactions": [{"name": "de", "count": 1}]},
-    }
+    })
 
     payload = _message_changed_payload(reactions=None)
     with TestClient(app) as client:
@@ -174,7 +183,7 @@ def test_message_changed_fetches_reactions_when_not_in_payload(
     assert mock_post_reply.call_count == 1
 
 
-@patch("httpx.post")
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
 @patch("slack_translate_bot.main._post_thread_reply", return_value=True)
 @patch("slack_translate_bot.main._translate_headline_and_body", return_value="Hallo Welt")
 @patch("slack_translate_bot.main.verify_slack_request", return_value=True)
@@ -183,15 +192,15 @@ def test_message_changed_skips_when_live_reactions_do_not_include_trigger(
     mock_config, _mock_verify, mock_translate, mock_post_reply, mock_http_post
 ):
     mock_config.TRANSLATE_TRIGGER = "reaction"
+    mock_config.IDEMPOTENCY_TTL_SECONDS = 3600
     mock_config.REACTION_TRIGGER_EMOJI = "de"
     mock_config.CHANNEL_IDS_LIST = []
     mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
-    mock_http_post.return_value.status_code = 200
-    mock_http_post.return_value.json.return_value = {
+    mock_http_post.return_value = httpx.Response(200, json={
         "ok": True,
         "type": "message",
         "message": {"reactions": [{"name": "white_check_mark", "count": 1}]},
-    }
+    })
 
     payload = _message_changed_payload(reactions=None)
     with TestClient(app) as client:
@@ -207,3 +216,124 @@ def test_message_changed_skips_when_live_reactions_do_not_include_trigger(
     assert res.status_code == 200
     mock_translate.assert_not_called()
     mock_post_reply.assert_not_called()
+
+
+@patch("slack_translate_bot.main.verify_slack_request", return_value=True)
+@patch("slack_translate_bot.main.config")
+def test_reaction_mode_acks_unrelated_events_before_parsing(mock_config, mock_verify):
+    mock_config.TRANSLATE_TRIGGER = "reaction"
+    mock_config.IDEMPOTENCY_TTL_SECONDS = 3600
+
+    payload = {
+        "type": "event_callback",
+        "event": {"type": "member_joined_channel", "channel": "C123", "user": "U123"},
+    }
+    with TestClient(app) as client:
+        res = client.post(
+            "/slack/events",
+            json=payload,
+            headers={
+                "x-slack-signature": "v0=fake",
+                "x-slack-request-timestamp": "1700000000",
+            },
+        )
+
+    assert res.status_code == 200
+    mock_verify.assert_not_called()
+
+
+@patch("slack_translate_bot.main.verify_slack_request", return_value=True)
+@patch("slack_translate_bot.main.config")
+def test_reaction_mode_prefilter_ignores_the_word_message_in_values(mock_config, mock_verify):
+    """A payload that only mentions "message" as a value (not as an event type) is acked unparsed."""
+    mock_config.TRANSLATE_TRIGGER = "reaction"
+    mock_config.IDEMPOTENCY_TTL_SECONDS = 3600
+
+    payload = {
+        "type": "event_callback",
+        "event": {"type": "app_mention", "channel": "C123", "text": "message", "subtype": "message"},
+    }
+    with TestClient(app) as client:
+        res = client.post(
+            "/slack/events",
+            json=payload,
+            headers={"x-slack-signature": "v0=fake", "x-slack-request-timestamp": "1700000000"},
+        )
+
+    assert res.status_code == 200
+    mock_verify.assert_not_called()
+
+
+@patch("slack_translate_bot.main._post_thread_reply", new_callable=AsyncMock, return_value=True)
+@patch("slack_translate_bot.main._translate_headline_and_body", new_callable=AsyncMock, return_value="Hallo Welt")
+@patch("slack_translate_bot.main._fetch_message", new_callable=AsyncMock)
+@patch("slack_translate_bot.main.verify_slack_request", return_value=True)
+@patch("slack_translate_bot.main.config")
+def test_reaction_on_recent_message_skips_fetch(
+    mock_config, _mock_verify, mock_fetch, mock_translate, mock_post_reply
+):
+    mock_config.TRANSLATE_TRIGGER = "reaction"
+    mock_config.IDEMPOTENCY_TTL_SECONDS = 3600
+    mock_config.REACTION_TRIGGER_EMOJI = "de"
+    mock_config.CHANNEL_IDS_LIST = []
+    mock_config.EXTRACT_PHRASES_LIST = []
+    headers = {"x-slack-signature": "v0=fake", "x-slack-request-timestamp": "1700000000"}
+    message = {
+        "type": "event_callback",
+        "event": {"type": "message", "channel": "C123", "ts": "222.001", "thread_ts": "222.000", "text": "Hello world"},
+    }
+    reaction = {
+        "type": "event_callback",
+        "event": {
+            "type": "reaction_added",
+            "reaction": "de",
+            "item": {"type": "message", "channel": "C123", "ts": "222.001"},
+        },
+    }
+    with TestClient(app) as client:
+        assert client.post("/slack/events", json=message, headers=headers).status_code == 200
+        mock_translate.assert_not_called()
+        assert client.post("/slack/events", json=reaction, headers=headers).status_code == 200
+
+    mock_fetch.assert_not_called()
+    mock_translate.assert_awaited_once_with("Hello world")
+    mock_post_reply.assert_awaited_once_with("C123", "222.000", "Hallo Welt")
+
+
+def test_url_verification_echoes_challenge():
+    client = TestClient(app)
+    response = client.post("/slack/events", json={"type": "url_verification", "challenge": "abc123"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"challenge": "abc123"}
+
+
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+@patch("slack_translate_bot.main.verify_slack_request", return_value=True)
+@patch("slack_translate_bot.main.config")
+def test_reactions_get_cached_until_reaction_event(mock_config, _mock_verify, mock_http_post):
+    mock_config.TRANSLATE_TRIGGER = "reaction"
+    mock_config.IDEMPOTENCY_TTL_SECONDS = 3600
+    mock_config.REACTION_TRIGGER_EMOJI = "de"
+    mock_config.SLACK_BOT_TOKEN = "xoxb-fake"
+    mock_http_post.return_value = httpx.Response(200, json={
+        "ok": True,
+        "message": {"reactions": [{"name": "de", "count": 1}]},
+    })
+
+    assert asyncio.run(main_mod._fetch_message_reactions("C123", "111.001")) == [{"name": "de", "count": 1}]
+    assert asyncio.run(main_mod._fetch_message_reactions("C123", "111.001")) == [{"name": "de", "count": 1}]
+    assert mock_http_post.call_count == 1
+
+    removed = {
+        "type": "event_callback",
+        "event": {"type": "reaction_removed", "reaction": "de", "item": {"type": "message", "channel": "C123", "ts": "111.001"}},
+    }
+    with TestClient(app) as client:
+        client.post(
+            "/slack/events",
+            json=removed,
+            headers={"x-slack-signature": "v0=fake", "x-slack-request-timestamp": "1700000000"},
+        )
+    assert ("C123", "111.001") not in main_mod._reactions_cache
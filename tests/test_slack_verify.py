@@ -0,0 +1,46 @@
+"""
+Tests for Slack request signature verification (HMAC-SHA256 over "v0:{timestamp}:{body}").
+"""
+
+import hashlib
+import hmac
+import time
+from unittest.mock import patch
+
+from slack_translate_bot.slack_verify import verify_slack_request
+
+SECRET = "8f742231b10e8888abcd99yyyzzz85a5"
+BODY = b'{"type":"event_callback","event":{"type":"reaction_added"}}'
+
+
+def _sign(body: bytes, timestamp: str, secret: str = SECRET) -> str:
+    base = f"v0:{timestamp}:".encode("utf-8") + body
+    return "v0=" + hmac.new(secret.encode("utf-8"), base, hashlib.sha256).hexdigest()
+
+
+@patch("slack_translate_bot.slack_verify.config")
+def test_valid_signature_accepted(mock_config):
+    mock_config.SLACK_SIGNING_SECRET = SECRET
+    mock_config.SLACK_REQUEST_MAX_AGE_SECONDS = 300
+    ts = str(int(time.time()))
+    assert verify_slack_request(BODY, _sign(BODY, ts), ts) is True
+
+
+@patch("slack_translate_bot.slack_verify.config")
+def test_tampered_body_or_wrong_secret_rejected(mock_config):
+    mock_config.SLACK_SIGNING_SECRET = SECRET
+    mock_config.SLACK_REQUEST_MAX_AGE_SECONDS = 300
+    ts = str(int(time.time()))
+    assert verify_slack_request(BODY + b" ", _sign(BODY, ts), ts) is False
+    assert verify_slack_request(BODY, _sign(BODY, ts, secret="other"), ts) is False
+    assert verify_slack_request(BODY, "v0=\u00e9" + _sign(BODY, ts)[4:], ts) is False
+
+
+@patch("slack_translate_bot.slack_verify.config")
+def test_stale_or_missing_timestamp_rejected(mock_config):
+    mock_config.SLACK_SIGNING_SECRET = SECRET
+    mock_config.SLACK_REQUEST_MAX_AGE_SECONDS = 300
+    old_ts = str(int(time.time()) - 3600)
+    assert verify_slack_request(BODY, _sign(BODY, old_ts), old_ts) is False
+    assert verify_slack_request(BODY, _sign(BODY, "x"), "x") is False
+    assert verify_slack_request(BODY, None, None) is False
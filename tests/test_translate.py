@@ -2,10 +2,37 @@
 Tests for EN->DE translation (DeepL mocked; no real API calls).
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
+import slack_translate_bot.main as main_mod
+from slack_translate_bot import translate as translate_mod
 from slack_translate_bot.main import _translate_headline_and_body
-from slack_translate_bot.translate import translate_en_to_de
+from slack_translate_bot.translate import translate_en_to_de, translate_en_to_de_batch
+
+
+@pytest.fixture
+def echo_translator():
+    """DeepL Translator mock that 'translates' every text to DE:<text>, detected as English."""
+    class FakeResult:
+        detected_source_lang = "EN"
+        def __init__(self, text):
+            self.text = text
+    translator = MagicMock()
+    translator.translate_text.side_effect = lambda texts, **kw: [FakeResult(f"DE:{t}") for t in texts]
+    with patch("deepl.Translator", return_value=translator), patch("slack_translate_bot.translate.config") as mock_config:
+        mock_config.DEEPL_API_KEY = "fake-key"
+        yield translator
+
+
+@pytest.fixture(autouse=True)
+def clear_translation_cache(monkeypatch):
+    translate_mod.clear_translation_cache()
+    monkeypatch.setattr(translate_mod, "_translator", None)
+    yield
+    translate_mod.clear_translation_cache()
 
 
 def test_translate_empty_returns_none():
@@ -26,16 +53,18 @@ def test_translate_returns_none_when_no_api_key(mock_config):
 def test_translate_mock_deepl_returns_german(mock_config, mock_deepl_translator):
     """When DeepL returns EN->DE, we return the translated text."""
     mock_config.DEEPL_API_KEY = "fake-key"
-    # Use simple object so code treats as single result (not iterable list)
     class FakeResult:
         detected_source_lang = "EN"
         text = "Hallo, wie geht es dir?"
     mock_translator = MagicMock()
-    mock_translator.translate_text.return_value = FakeResult()
+    mock_translator.translate_text.return_value = [FakeResult()]
     mock_deepl_translator.return_value = mock_translator
 
     got = translate_en_to_de("Hello, how are you?")
     assert got == "Hallo, wie geht es dir?"
+    # Same text again (other whitespace) is served from the cache
+    assert translate_en_to_de("  Hello, how are you?\n") == "Hallo, wie geht es dir?"
+    mock_translator.translate_text.assert_called_once_with(["Hello, how are you?"], target_lang="DE")
 
 
 @patch("deepl.Translator")
@@ -47,31 +76,165 @@ def test_translate_mock_deepl_non_en_returns_none(mock_config, mock_deepl_transl
         detected_source_lang = "DE"
         text = "Unverändert"
     mock_translator = MagicMock()
-    mock_translator.translate_text.return_value = FakeResult()
+    mock_translator.translate_text.return_value = [FakeResult()]
     mock_deepl_translator.return_value = mock_translator
 
     got = translate_en_to_de("Some German text")
     assert got is None
 
 
+@patch("deepl.Translator")
+@patch("slack_translate_bot.translate.config")
+def test_translate_batch_single_request_filters_non_en(mock_config, mock_deepl_translator):
+    """Batch translation sends all texts in one DeepL call; non-English segments come back as None."""
+    mock_config.DEEPL_API_KEY = "fake-key"
+    class FakeResult:
+        def __init__(self, lang, text):
+            self.detected_source_lang = lang
+            self.text = text
+    mock_translator = MagicMock()
+    mock_translator.translate_text.return_value = [
+        FakeResult("EN", "Krypto-Aktien legen zu"),
+        FakeResult("DE", "Schon deutsch"),
+    ]
+    mock_deepl_translator.return_value = mock_translator
+
+    got = translate_en_to_de_batch(["Crypto stocks jump", "", "Schon deutsch"])
+    assert got == ["Krypto-Aktien legen zu", None, None]
+    mock_translator.translate_text.assert_called_once_with(
+        ["Crypto stocks jump", "Schon deutsch"], target_lang="DE"
+    )
+
+
+def test_translate_batch_reuses_cached_results(echo_translator):
+    """Texts translated before are served from the cache; only new texts go to DeepL."""
+    assert translate_en_to_de_batch(["Deploy complete"]) == ["DE:Deploy complete"]
+    assert translate_en_to_de_batch(["  Deploy complete ", "PR merged"]) == ["DE:Deploy complete", "DE:PR merged"]
+    assert echo_translator.translate_text.call_count == 2
+    assert echo_translator.translate_text.call_args.args[0] == ["PR merged"]
+    # Composed and decomposed accents share one cache entry
+    assert translate_en_to_de_batch(["Caf\u00e9 open"]) == ["DE:Caf\u00e9 open"]
+    assert translate_en_to_de_batch(["Cafe\u0301 open"]) == ["DE:Caf\u00e9 open"]
+    assert echo_translator.translate_text.call_count == 3
+
+
+def test_translate_batch_skips_clearly_german_text(echo_translator):
+    """Clearly German segments are not sent to DeepL; English ones with German names still are."""
+    german = "Das ist nicht gut und wir müssen das noch prüfen"
+    english = "Meeting with Herr Müller about the Straße project is at 3pm"
+    assert translate_en_to_de_batch([german, english]) == [None, f"DE:{english}"]
+    echo_translator.translate_text.assert_called_once_with([english], target_lang="DE")
+    assert translate_en_to_de(german) is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Meeting with Herr Müller about the Straße project is at 3pm",
+        "Ich bin ein Berliner said JFK",
+        "Meeting notes: Das Boot screening and Der Spiegel article, ein Prosit",
+        "The team watched Das Boot and read Der Spiegel, ein classic, over lunch",
+    ],
+)
+def test_english_quoting_german_is_not_treated_as_german(text):
+    assert not translate_mod._looks_german(text)
+
+
+def test_translate_batch_splits_at_deepl_text_limit(echo_translator):
+    """More than 50 texts are sent as several requests, in order."""
+    texts = [f"line {n}" for n in range(51)]
+    assert translate_en_to_de_batch(texts) == [f"DE:line {n}" for n in range(51)]
+    assert [len(c.args[0]) for c in echo_translator.translate_text.call_args_list] == [50, 1]
+
+
+def test_translator_reused_and_dropped_on_auth_error(echo_translator):
+    """One Translator serves all calls; a rejected key forces a new one on the next call."""
+    import deepl
+
+    assert translate_en_to_de_batch(["one"]) == ["DE:one"]
+    assert translate_en_to_de_batch(["two"]) == ["DE:two"]
+    assert deepl.Translator.call_count == 1
+
+    echo_translator.translate_text.side_effect = deepl.AuthorizationException("bad key")
+    assert translate_en_to_de_batch(["three"]) == [None]
+    assert translate_mod._translator is None
+
+
 # --- _translate_headline_and_body: headline and body translated separately, joined by newline ---
 
 
-@patch("slack_translate_bot.main.translate_en_to_de")
+@patch("slack_translate_bot.main.translate_en_to_de_batch")
 def test_translate_headline_and_body_keeps_two_lines(mock_translate):
-    """Headline and body are translated separately and joined with newline."""
-    def side_effect(text):
+    """Headline and body are translated separately (one batched call) and joined with newline."""
+    def translate_one(text):
         if "Crypto stocks jump" in text:
             return "Krypto-Aktien legen zu"
         if "Strategy +8%" in text or "Coinbase" in text:
             return "Strategy +8 %, Coinbase +14 %, da die verbesserte Risikostimmung den Sektor beflügelt."
         return None
-    mock_translate.side_effect = side_effect
+    mock_translate.side_effect = lambda texts: [translate_one(t) for t in texts]
 
     text = ":loudspeaker: Crypto stocks jump\nStrategy +8%, Coinbase +14% as improving risk sentiment lifts the sector."
-    got = _translate_headline_and_body(text)
+    got = asyncio.run(_translate_headline_and_body(text))
     assert got is not None
     lines = got.split("\n")
     assert len(lines) == 2
     assert "Krypto-Aktien" in lines[0]
     assert "Strategy +8 %" in lines[1] or "Coinbase" in lines[1]
+    mock_translate.assert_called_once()
+
+
+@patch("slack_translate_bot.main.translate_en_to_de_batch")
+def test_translate_headline_and_body_skips_segments_without_words(mock_translate):
+    """Emoji/punctuation-only segments are not sent to DeepL; numbers are (DeepL localizes them)."""
+    mock_translate.side_effect = lambda texts: ["Gold legt zu" for _ in texts]
+
+    got = asyncio.run(_translate_headline_and_body(":rocket: :tada:\nGold rallies"))
+    assert got == ":rocket: :tada:\nGold legt zu"
+    mock_translate.assert_called_once_with(["Gold rallies"])
+
+    mock_translate.reset_mock()
+    mock_translate.side_effect = lambda texts: [":EMOJISLACK0: +2,4 % :EMOJISLACK1:" for _ in texts]
+    got = asyncio.run(_translate_headline_and_body(":rocket: +2.4% :tada:"))
+    assert got == ":rocket: +2,4 % :tada:"
+    mock_translate.assert_called_once_with([":EMOJISLACK0: +2.4% :EMOJISLACK1:"])
+
+    mock_translate.reset_mock()
+    assert asyncio.run(_translate_headline_and_body(":rocket: :tada: !!")) is None
+    mock_translate.assert_not_called()
+
+
+@patch("slack_translate_bot.main.translate_en_to_de_batch")
+def test_translate_headline_and_body_uses_shared_redis_cache(mock_translate, monkeypatch):
+    """With Redis configured, cached segments skip DeepL and new translations are stored."""
+    fake_redis = AsyncMock()
+    fake_redis.mget.return_value = [b"Krypto-Aktien legen zu", None]
+    monkeypatch.setattr(main_mod, "_get_translation_redis", lambda: fake_redis)
+    mock_translate.side_effect = lambda texts: ["Gold legt zu" for _ in texts]
+
+    got = asyncio.run(_translate_headline_and_body("Crypto stocks jump\nGold rallies"))
+    assert got == "Krypto-Aktien legen zu\nGold legt zu"
+    mock_translate.assert_called_once_with(["Gold rallies"])
+    fake_redis.set.assert_awaited_once()
+    assert fake_redis.set.call_args.args == (main_mod._translation_cache_key("Gold rallies"), "Gold legt zu")
+    # Same normalization as the in-process LRU: whitespace and composed/decomposed accents share a key
+    assert main_mod._translation_cache_key(" Caf\u00e9 ") == main_mod._translation_cache_key("Cafe\u0301")
+
+
+@patch("slack_translate_bot.main.translate_en_to_de_batch")
+def test_translate_segments_checks_local_cache_before_redis(mock_translate, monkeypatch):
+    """Local LRU hits never reach Redis; Redis hits are copied into the LRU."""
+    fake_redis = AsyncMock()
+    fake_redis.mget.return_value = [b"Krypto-Aktien legen zu"]
+    monkeypatch.setattr(main_mod, "_get_translation_redis", lambda: fake_redis)
+    translate_mod.store_translations([("Gold rallies", "Gold legt zu")])
+
+    got = asyncio.run(main_mod._translate_segments(["Gold rallies", "Crypto stocks jump"]))
+    assert got == ["Gold legt zu", "Krypto-Aktien legen zu"]
+    fake_redis.mget.assert_awaited_once_with([main_mod._translation_cache_key("Crypto stocks jump")])
+    mock_translate.assert_not_called()
+
+    fake_redis.mget.reset_mock()
+    got = asyncio.run(main_mod._translate_segments(["Crypto stocks jump"]))
+    assert got == ["Krypto-Aktien legen zu"]
+    fake_redis.mget.assert_not_called()
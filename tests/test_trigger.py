@@ -0,0 +1,54 @@
+"""
+Tests for _should_translate_and_strip: prefix and mention triggers strip their marker before translating.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import slack_translate_bot.main as main_mod
+from slack_translate_bot.main import _should_translate_and_strip
+
+
+@pytest.fixture(autouse=True)
+def no_cached_bot_mention(monkeypatch):
+    monkeypatch.setattr(main_mod, "_bot_mention", None)
+
+
+@patch("slack_translate_bot.main.config")
+def test_prefix_trigger_strips_prefix(mock_config):
+    """Only messages starting with the prefix are translated, without the prefix."""
+    mock_config.TRANSLATE_TRIGGER = "prefix"
+    mock_config.TRANSLATE_PREFIX = "[translate]"
+    assert asyncio.run(_should_translate_and_strip("[translate] Gold rallies")) == "Gold rallies"
+    assert asyncio.run(_should_translate_and_strip("Gold rallies")) is None
+    assert asyncio.run(_should_translate_and_strip("[translate]   ")) is None
+
+
+@patch("slack_translate_bot.main._get_bot_user_id", new_callable=AsyncMock, return_value="UBOT")
+@patch("slack_translate_bot.main.config")
+def test_mention_trigger_strips_mention_and_collapses_spaces(mock_config, _mock_bot_id):
+    """The bot mention is removed and surrounding whitespace collapsed."""
+    mock_config.TRANSLATE_TRIGGER = "mention"
+    got = asyncio.run(_should_translate_and_strip("Hey <@UBOT>   please\ttranslate  this"))
+    assert got == "Hey please translate this"
+
+
+@patch("slack_translate_bot.main._get_bot_user_id", new_callable=AsyncMock, return_value="UBOT")
+@patch("slack_translate_bot.main.config")
+def test_mention_trigger_ignores_messages_without_mention(mock_config, _mock_bot_id):
+    """Messages that don't mention the bot (or only mention it) are not translated."""
+    mock_config.TRANSLATE_TRIGGER = "mention"
+    assert asyncio.run(_should_translate_and_strip("Hey <@UOTHER> hello")) is None
+    assert asyncio.run(_should_translate_and_strip("<@UBOT>")) is None
+
+
+@patch("slack_translate_bot.main._get_bot_user_id", new_callable=AsyncMock)
+@patch("slack_translate_bot.main.config")
+def test_mention_trigger_uses_cached_mention(mock_config, mock_bot_id, monkeypatch):
+    """Once the bot ID is known, the prebuilt mention is used without another lookup."""
+    mock_config.TRANSLATE_TRIGGER = "mention"
+    monkeypatch.setattr(main_mod, "_bot_mention", "<@UBOT>")
+    assert asyncio.run(_should_translate_and_strip("<@UBOT> Gold rallies")) == "Gold rallies"
+    mock_bot_id.assert_not_called()